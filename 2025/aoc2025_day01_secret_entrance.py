@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """Advent of Code 2025 - Day 1: Secret Entrance (https://adventofcode.com/2025/day/1)"""
 
+import itertools
+import random
+from array import array
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
-import pytest
-
-from aoc import puzzle_input_as_list
+from aoc import extract_ints, parametrize, puzzle_input_lines, run_tests
 
 START_POSITION = 50
 DIAL_SIZE = 100
+ROTATIONS_CHUNK_SIZE = 4096
 
 
 @dataclass
@@ -68,56 +71,66 @@ class Example:
 ]
 
 
-def parse_rotation(rotation: str) -> int:
-    direction, clicks = rotation[0], int(rotation[1:])
-    if direction == "L":
-        return -clicks
+def parse(rotations: Iterable[str]) -> array:
+    # clicks (left is negative), parsed in bulk per chunk of ROTATIONS_CHUNK_SIZE rotations: memory is O(n) (8 bytes
+    # per rotation, shared by both parts), a chunk only adds a fixed amount on top
+    clicks = array("q")
+    rotations = iter(rotations)
+    while chunk := list(itertools.islice(rotations, ROTATIONS_CHUNK_SIZE)):
+        clicks.extend(extract_ints(" ".join(chunk).replace("L", "-")))
     return clicks
 
 
-def part_1(rotations: list[str]) -> int:
+def part_1(clicks: array) -> int:
     position = START_POSITION
     times_landed_on_zero = 0
-    for rotation in rotations:
-        clicks = parse_rotation(rotation)
-        position = (position + clicks) % DIAL_SIZE
+    for click in clicks:
+        position = (position + click) % DIAL_SIZE
         if position == 0:
             times_landed_on_zero += 1
     return times_landed_on_zero
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.rotations) == example.times_zero
+    assert part_1(parse(example.rotations)) == example.times_zero
 
 
-def part_2(rotations: list[str]) -> int:
+def part_2(clicks: array) -> int:
     position = START_POSITION
     landing_on_or_passing_zero = 0
-    for rotation in rotations:
-        clicks = parse_rotation(rotation)
-        rounds, new_position = divmod(position + clicks, DIAL_SIZE)
-        landing_on_or_passing_zero += abs(rounds)
-        if clicks < 0:
-            if position == 0:
-                landing_on_or_passing_zero -= 1
-            if new_position == 0:
-                landing_on_or_passing_zero += 1
+    for click in clicks:
+        rounds, new_position = divmod(position + click, DIAL_SIZE)
+        if click < 0:
+            # rounds is negative (or zero) to the left: starting on zero doesn't count, ending on zero does
+            rounds = (new_position == 0) - (position == 0) - rounds
+        landing_on_or_passing_zero += rounds
         position = new_position
     return landing_on_or_passing_zero
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
+@parametrize("example", EXAMPLES_PART_2)
 def test_part_2(example: Example) -> None:
-    assert part_2(example.rotations) == example.times_zero
+    assert part_2(parse(example.rotations)) == example.times_zero
+
+
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # `size` rotations
+    rng = random.Random(seed)
+    return "".join(f"{rng.choice('LR')}{rng.randint(1, 999)}\n" for _ in range(size))
+
+
+def puzzle_input() -> Iterator[str]:
+    return puzzle_input_lines()
 
 
 def main():
+    clicks = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_list())}")  # 1059
-    print(f"- Part 2: {part_2(puzzle_input_as_list())}")  # 6305
+    print(f"- Part 1: {part_1(clicks)}")  # 1059
+    print(f"- Part 2: {part_2(clicks)}")  # 6305
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
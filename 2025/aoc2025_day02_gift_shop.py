@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 """Advent of Code 2025 - Day 2: Gift Shop (https://adventofcode.com/2025/day/2)"""
 
+import random
 from dataclasses import dataclass
 from functools import cache
 
-import pytest
-
-from aoc import puzzle_input_as_str
+from aoc import extract_ints, parametrize, puzzle_input_as_str, run_tests
 
 
 @dataclass
@@ -80,24 +79,65 @@ class CheckPattern:
 ]
 
 
-def parse_ranges(ranges: str) -> list[tuple[int, int]]:
-    return [(int(start), int(end)) for start, end in (r.split("-") for r in ranges.split(","))]
+@dataclass
+class RepeatedBlock:
+    length: int
+    block_length: int
+    numbers: range
+
+
+REPEATED_BLOCKS = [
+    RepeatedBlock(1, 1, range(1, 10)),
+    RepeatedBlock(2, 1, range(11, 100, 11)),
+    RepeatedBlock(4, 2, range(1010, 10000, 101)),
+    RepeatedBlock(6, 2, range(101010, 1000000, 10101)),
+    RepeatedBlock(6, 3, range(100100, 1000000, 1001)),
+]
+
+
+def parse(ranges: str) -> list[tuple[int, int]]:
+    bounds = extract_ints(ranges, signed=False)
+    return list(zip(bounds[::2], bounds[1::2]))
+
+
+def repeated_block_numbers(length: int, block_length: int) -> range:
+    # numbers of `length` digits consisting of a repeated block of `block_length` digits are
+    # block * 1..01..01 (e.g. 123123 = 123 * 1001), so they are a range with that multiplier as step
+    multiplier = (10**length - 1) // (10**block_length - 1)
+    return range(10 ** (block_length - 1) * multiplier, 10**block_length * multiplier, multiplier)
+
+
+@parametrize("repeated_block", REPEATED_BLOCKS)
+def test_repeated_block_numbers(repeated_block: RepeatedBlock) -> None:
+    assert repeated_block_numbers(repeated_block.length, repeated_block.block_length) == repeated_block.numbers
+
 
+def sum_repeated_block_numbers(start: int, end: int, length: int, block_length: int) -> int:
+    numbers = repeated_block_numbers(length, block_length)
+    step = numbers.step
+    first = max(numbers.start, -(-start // step) * step)
+    last = min(numbers[-1], end // step * step)
+    if first > last:
+        return 0
+    return (first + last) * ((last - first) // step + 1) // 2
 
-def part_1(ranges: str) -> int:
+
+def number_lengths(start: int, end: int) -> range:
+    return range(len(str(start)), len(str(end)) + 1)
+
+
+def part_1(ranges: list[tuple[int, int]]) -> int:
     sum_invalid_ids = 0
-    for start, end in parse_ranges(ranges):
-        for product_id in range(start, end + 1):
-            str_id = str(product_id)
-            str_id_half_pos = len(str_id) // 2
-            if str_id[str_id_half_pos:] == str_id[:str_id_half_pos]:
-                sum_invalid_ids += product_id
+    for start, end in ranges:
+        for length in number_lengths(start, end):
+            if length % 2 == 0:
+                sum_invalid_ids += sum_repeated_block_numbers(start, end, length, length // 2)
     return sum_invalid_ids
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.ranges) == example.sum_invalid_ids
+    assert part_1(parse(example.ranges)) == example.sum_invalid_ids
 
 
 @cache
@@ -105,36 +145,55 @@ def lengths_to_be_checked(len_str: int) -> list[int]:
     return [i for i in range(1, len_str) if len_str % i == 0]
 
 
-@pytest.mark.parametrize("check_pattern", CHECK_PATTERNS)
+@parametrize("check_pattern", CHECK_PATTERNS)
 def test_lengths_to_be_checked(check_pattern: CheckPattern) -> None:
     assert lengths_to_be_checked(check_pattern.str_len) == check_pattern.expected_pattern_lengths
 
 
-def part_2(ranges: str) -> int:
+def sum_smallest_block_numbers(start: int, end: int, length: int, block_length: int) -> int:
+    # numbers built from a block of `block_length` digits are also built from blocks of any length dividing
+    # `block_length`, exclude those to count every number exactly once (by its smallest block)
+    return sum_repeated_block_numbers(start, end, length, block_length) - sum(
+        sum_smallest_block_numbers(start, end, length, smaller_block_length)
+        for smaller_block_length in lengths_to_be_checked(block_length)
+    )
+
+
+def part_2(ranges: list[tuple[int, int]]) -> int:
     sum_invalid_ids = 0
-    for start, end in parse_ranges(ranges):
-        for product_id in range(start, end + 1):
-            str_id = str(product_id)
-            len_str_id = len(str_id)
-            for pattern_length in lengths_to_be_checked(len_str_id):
-                pieces = {str_id[i : i + pattern_length] for i in range(0, len_str_id, pattern_length)}
-                if len(pieces) == 1:
-                    sum_invalid_ids += product_id
-                    break
+    for start, end in ranges:
+        for length in number_lengths(start, end):
+            for block_length in lengths_to_be_checked(length):
+                sum_invalid_ids += sum_smallest_block_numbers(start, end, length, block_length)
     return sum_invalid_ids
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
+@parametrize("example", EXAMPLES_PART_2)
 def test_part_2(example: Example) -> None:
-    assert part_2(example.ranges) == example.sum_invalid_ids
+    assert part_2(parse(example.ranges)) == example.sum_invalid_ids
+
+
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # `size` ranges of IDs of up to 10 digits
+    rng = random.Random(seed)
+    ranges: list[str] = []
+    for _ in range(size):
+        first_id = rng.randint(1, 10 ** rng.randint(1, 10))
+        ranges.append(f"{first_id}-{first_id + rng.randint(0, 10 ** rng.randint(1, 6))}")
+    return ",".join(ranges) + "\n"
+
+
+def puzzle_input() -> str:
+    return puzzle_input_as_str()
 
 
 def main():
+    ranges = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_str())}")  # 12599655151
-    print(f"- Part 2: {part_2(puzzle_input_as_str())}")  # 20942028255
+    print(f"- Part 1: {part_1(ranges)}")  # 12599655151
+    print(f"- Part 2: {part_2(ranges)}")  # 20942028255
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
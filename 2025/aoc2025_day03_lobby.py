@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 """Advent of Code 2025 - Day 3: Lobby (https://adventofcode.com/2025/day/3)"""
 
+import io
+import random
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
-import pytest
+from aoc import parametrize, puzzle_input_lines, run_tests
 
-from aoc import puzzle_input_as_list
+BATTERIES_PART_2 = 12
+ZERO = ord("0")
+MAX_STR_DIGITS = 4000
 
 
 @dataclass
@@ -47,49 +52,94 @@ class Example:
 ]
 
 
-def part_1(banks: list[str]) -> int:
-    joltage = 0
+type BanksType = bytes  # banks (digits) separated by newlines
+
+
+def pair_joltage(bank: bytes) -> int:
+    # the largest battery (but the last) followed by the largest battery after it
+    max_battery_left = max(bank[:-1])
+    position = bank.index(max_battery_left)
+    max_battery_right = max(bank[position + 1 :])
+    return (max_battery_left - ZERO) * 10 + max_battery_right - ZERO
+
+
+def digits_as_int(digits: str) -> int:
+    # int() refuses strings above sys.get_int_max_str_digits(), so convert long strings in halves
+    if len(digits) <= MAX_STR_DIGITS:
+        return int(digits)
+    half = len(digits) // 2
+    return digits_as_int(digits[:half]) * 10 ** (len(digits) - half) + digits_as_int(digits[half:])
+
+
+def max_joltage(bank: str | bytes, batteries_to_keep: int) -> int:
+    # monotonic stack: a battery replaces smaller batteries before it as long as there are batteries left to drop
+    batteries = bank.encode("ascii") if isinstance(bank, str) else bank
+    batteries_to_drop = len(batteries) - batteries_to_keep
+    kept: list[int] = []
+    for battery in batteries:
+        while batteries_to_drop > 0 and kept and kept[-1] < battery:
+            kept.pop()
+            batteries_to_drop -= 1
+        kept.append(battery)
+    del kept[batteries_to_keep:]
+    return digits_as_int(bytes(kept).decode("ascii"))
+
+
+def parse(banks: Iterable[str]) -> BanksType:
+    # the (streamed) banks as one bytes object: a byte per battery instead of a str object per bank
+    batteries = io.BytesIO()
     for bank in banks:
-        max_battery_left = max(bank[:-1])
-        position = bank.find(max_battery_left)
-        max_battery_right = max(bank[position + 1 :])
-        joltage += int(max_battery_left + max_battery_right)
-    return joltage
+        batteries.write(bank.encode("ascii"))
+        batteries.write(b"\n")
+    return batteries.getvalue()  # no copy (the buffer is handed over)
+
+
+def bank_lines(banks: BanksType) -> Iterator[bytes]:
+    # one bank at a time (unlike bytes.split(), which creates all of them at once)
+    return (line.rstrip() for line in io.BytesIO(banks))
+
 
+def part_1(banks: BanksType) -> int:
+    return sum(pair_joltage(bank) for bank in bank_lines(banks))
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.banks) == example.joltage
+    assert part_1(parse(example.banks)) == example.joltage
 
 
-def part_2(banks: list[str], batteries_to_keep: int = 12) -> int:
-    joltage = 0
-    for bank in banks:
-        start = 0
-        bank_joltage = ""
-        batteries_to_find = batteries_to_keep
-        bank = f"{bank}0"  # avoid issue with bank[?:-0] ([:-0] doesn't work)
-        while batteries_to_find > 0:
-            max_battery = max(bank[start:-batteries_to_find])
-            position = bank[start:-batteries_to_find].find(max_battery) + start
-            bank_joltage += bank[position]
-            start = position + 1
-            batteries_to_find -= 1
-        joltage += int(bank_joltage)
-    return joltage
-
-
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
+def test_max_joltage() -> None:
+    for example in EXAMPLES_PART_1[:-1]:
+        bank = example.banks[0].encode("ascii")
+        assert max_joltage(bank, 2) == pair_joltage(bank) == example.joltage
+
+
+def part_2(banks: BanksType, batteries_to_keep: int = BATTERIES_PART_2) -> int:
+    return sum(max_joltage(bank, batteries_to_keep) for bank in bank_lines(banks))
+
+
+@parametrize("example", EXAMPLES_PART_2)
 def test_part_2(example: Example) -> None:
-    assert part_2(example.banks) == example.joltage
+    assert part_2(parse(example.banks)) == example.joltage
+
+
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # `size` banks of 100 batteries
+    rng = random.Random(seed)
+    return "".join("".join(rng.choices("123456789", k=100)) + "\n" for _ in range(size))
+
+
+def puzzle_input() -> Iterator[str]:
+    return puzzle_input_lines()
 
 
 def main():
+    banks = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_list())}")  # 17193
-    print(f"- Part 2: {part_2(puzzle_input_as_list())}")  # 171297349921310
+    print(f"- Part 1: {part_1(banks)}")  # 17193
+    print(f"- Part 2: {part_2(banks)}")  # 171297349921310
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
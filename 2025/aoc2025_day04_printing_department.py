@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 """Advent of Code 2025 - Day 4: Printing Department (https://adventofcode.com/2025/day/4)"""
 
+import random
+from collections import deque
 from dataclasses import dataclass
-from functools import cache
 
-import pytest
+from aoc import BitGrid, Grid, parametrize, puzzle_input_as_list, run_tests
 
-from aoc import puzzle_input_as_list
+MAX_ADJACENT_ROLLS = 4  # a roll can be accessed when it has fewer adjacent rolls
 
 
 @dataclass
@@ -52,78 +53,78 @@ class Neighbor:
 ]
 
 
-@cache
-def neighbors(row: int, col: int, max_row: int, max_col: int) -> list[tuple[int, int]]:
-    # fmt: off
-    candidates = [
-        (row-1, col-1), (row-1, col), (row-1, col+1),
-        (row,   col-1),               (row,   col+1 ),
-        (row+1, col-1), (row+1, col), (row+1, col+1),
-    ]
-    # fmt: on
-    return [(x, y) for x, y in candidates if (0 <= x <= max_row) and (0 <= y <= max_col)]
+@parametrize("neighbor", NEIGHBOR_EXAMPLES)
+def test_neighbors(neighbor: Neighbor) -> None:
+    grid = Grid(neighbor.max_row + 1, neighbor.max_col + 1)
+    assert grid.neighbors(neighbor.row, neighbor.col) == neighbor.neighbors
 
 
-@pytest.mark.parametrize("neighbor", NEIGHBOR_EXAMPLES)
-def test_neighbors(neighbor: Neighbor) -> None:
-    assert neighbors(neighbor.row, neighbor.col, neighbor.max_row, neighbor.max_col) == neighbor.neighbors
+def parse(paper_grid: list[str]) -> BitGrid:
+    # bitboard: the adjacent rolls of all rolls are counted at once (bit-sliced), no loop over the cells
+    return BitGrid.from_lines(paper_grid, "@")
 
 
-def parse_grid(paper_grid: list[str]) -> list[list[int]]:
-    return [[1 if cell == "@" else 0 for cell in row] for row in paper_grid]
+def test_fewer_neighbors() -> None:
+    grid, counts = parse(EXAMPLE_PAPER_ROLL_GRID), Grid.from_lines(EXAMPLE_PAPER_ROLL_GRID, {"@": 1})
+    neighbor_counts = counts.neighbor_counts()
+    for limit in range(10):
+        expected = {counts.position(index) for index in counts.indexes(1) if neighbor_counts[index] < limit}
+        fewer = BitGrid(grid.height, grid.width, grid.fewer_neighbors(limit))
+        assert {(row, col) for row in range(grid.height) for col in range(grid.width) if fewer[row, col]} == expected
 
 
-def part_1(paper_roll_grid: list[str]) -> int:
-    grid = parse_grid(paper_roll_grid)
-    max_row, max_col = len(grid) - 1, len(grid[0]) - 1
-    reachable_rolls = 0
-    for row in range(max_row + 1):
-        for col in range(max_col + 1):
-            if grid[row][col] == 1:
-                adjacent_rolls = sum(grid[r][c] for r, c in neighbors(row, col, max_row, max_col))
-                if adjacent_rolls < 4:
-                    reachable_rolls += 1
-    return reachable_rolls
+def part_1(grid: BitGrid) -> int:
+    return grid.fewer_neighbors(MAX_ADJACENT_ROLLS).bit_count()
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.paper_roll_grid) == example.rolls
+    assert part_1(parse(example.paper_roll_grid)) == example.rolls
 
 
-def part_2(paper_roll_grid: list[str]) -> int:
-    grid = parse_grid(paper_roll_grid)
-    max_row, max_col = len(grid) - 1, len(grid[0]) - 1
+def part_2(grid: BitGrid) -> int:
+    # the accessible rolls at the start at once on the bitboard, after that removing a roll only changes the counts
+    # of its neighbors: peel with a worklist (linear in the number of rolls, instead of recounting every round)
+    rolls = grid.to_grid()  # flat cells (with a border) to remove rolls from, the parsed grid is shared
+    cells, neighbor_offsets, adjacent_rolls = rolls.cells, rolls.neighbor_offsets, rolls.neighbor_counts()
+    accessible = BitGrid(grid.height, grid.width, grid.fewer_neighbors(MAX_ADJACENT_ROLLS))
+    rolls_to_remove = deque(accessible.to_grid().indexes(1))  # same flat layout as rolls
     rolls_removed = 0
-    while True:
-        rolls_to_remove: set[tuple[int, int]] = set()
-        # find rolls that can be removed
-        for row in range(max_row + 1):
-            for col in range(max_col + 1):
-                if grid[row][col] == 1:
-                    adjacent_rolls = sum(grid[r][c] for r, c in neighbors(row, col, max_row, max_col))
-                    if adjacent_rolls < 4:
-                        rolls_to_remove.add((row, col))
-        # remove rolls
-        if not rolls_to_remove:
-            break
-        rolls_removed += len(rolls_to_remove)
-        for row, col in rolls_to_remove:
-            grid[row][col] = 0
+    while rolls_to_remove:
+        index = rolls_to_remove.popleft()
+        cells[index] = 0
+        rolls_removed += 1
+        for offset in neighbor_offsets:
+            neighbor = index + offset
+            if cells[neighbor] == 1:  # the border is never a roll
+                adjacent_rolls[neighbor] -= 1
+                if adjacent_rolls[neighbor] == MAX_ADJACENT_ROLLS - 1:  # just became accessible (only happens once)
+                    rolls_to_remove.append(neighbor)
     return rolls_removed
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
+@parametrize("example", EXAMPLES_PART_2)
 def test_part_2(example: Example) -> None:
-    assert part_2(example.paper_roll_grid) == example.rolls
+    assert part_2(parse(example.paper_roll_grid)) == example.rolls
+
+
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # `size` x `size` grid, 3 out of 4 positions a roll
+    rng = random.Random(seed)
+    return "".join("".join(rng.choices("@@@.", k=size)) + "\n" for _ in range(size))
+
+
+def puzzle_input() -> list[str]:
+    return puzzle_input_as_list()
 
 
 def main():
+    grid = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_list())}")  # 1344
-    print(f"- Part 2: {part_2(puzzle_input_as_list())}")  # 8112
+    print(f"- Part 1: {part_1(grid)}")  # 1344
+    print(f"- Part 2: {part_2(grid)}")  # 8112
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
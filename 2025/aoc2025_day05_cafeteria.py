@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """Advent of Code 2025 - Day 5: Cafeteria (https://adventofcode.com/2025/day/5)"""
 
+import random
+from array import array
 from dataclasses import dataclass
 
-import pytest
-
-from aoc import puzzle_input_as_list
+from aoc import IntervalSet, extract_ints, parametrize, puzzle_input_as_list, run_tests
 
 
 @dataclass
@@ -32,73 +32,90 @@ class Example:
 
 EXAMPLES_PART_2 = [Example(EXAMPLE_DATABASE, 14)]
 
-type RangeListType = list[tuple[int, int]]
-type IngredientListType = list[int]
-
-
-def parse_database(database: list[str]) -> tuple[RangeListType, IngredientListType]:
-    ingredient_ranges: RangeListType = []
-    ingredients: IngredientListType = []
-    in_ranges = True
-    for line in database:
-        if not line:
-            in_ranges = False
-            continue
-        if in_ranges:
-            start, end = map(int, line.split("-"))
-            ingredient_ranges.append((start, end))
-        else:
-            ingredients.append(int(line))
-    return ingredient_ranges, ingredients
-
-
-def part_1(database: list[str]) -> int:
-    ingredient_ranges, ingredients = parse_database(database)
-    fresh = 0
-    for ingredient in ingredients:
-        for start, end in ingredient_ranges:
-            if start <= ingredient <= end:
-                fresh += 1
-                break
-    return fresh
-
-
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+
+@dataclass
+class MergeExample:
+    ranges: list[tuple[int, int]]
+    starts: list[int]
+    ends: list[int]
+
+
+MERGE_EXAMPLES = [
+    MergeExample([], [], []),
+    MergeExample([(3, 5), (10, 14), (16, 20), (12, 18)], [3, 10], [5, 20]),
+    MergeExample([(5, 8), (1, 2), (3, 4)], [1], [8]),
+    MergeExample([(1, 10), (2, 3), (10, 10), (12, 13)], [1, 12], [10, 13]),
+]
+
+type IngredientListType = array
+type DatabaseType = tuple[IntervalSet, IngredientListType]  # fresh ingredient ranges (merged) and ingredients
+
+
+def parse(database: list[str]) -> DatabaseType:
+    # ranges and ingredients are separated by the first empty line
+    separator = database.index("") if "" in database else len(database)
+    bounds = extract_ints("\n".join(database[:separator]), signed=False)
+    ingredients = extract_ints("\n".join(database[separator + 1 :]), signed=False)
+    return IntervalSet(zip(bounds[::2], bounds[1::2])), ingredients
+
+
+@parametrize("merge_example", MERGE_EXAMPLES)
+def test_merge_ranges(merge_example: MergeExample) -> None:
+    fresh = IntervalSet(merge_example.ranges)
+    assert (list(fresh.starts), list(fresh.ends)) == (merge_example.starts, merge_example.ends)
+    fresh_one_by_one = IntervalSet()
+    for start, end in merge_example.ranges:
+        fresh_one_by_one.add(start, end)
+    assert fresh_one_by_one == fresh
+
+
+def part_1(database: DatabaseType) -> int:
+    fresh, ingredients = database
+    return sum(fresh.contains_many(ingredients))
+
+
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.database) == example.fresh_ingredients
-
-
-def part_2(database: list[str]) -> int:
-    ingredient_ranges, _ = parse_database(database)
-    ranges: RangeListType = []
-    while ingredient_ranges:
-        start, end = ingredient_ranges.pop()
-        new_ranges: RangeListType = []
-        while ranges:
-            known_start, known_end = ranges.pop()
-            if (start > known_end) or (end < known_start):
-                new_ranges.append((known_start, known_end))
-            elif start < known_start <= end <= known_end:
-                end = known_end
-            elif start >= known_start:
-                start = known_start
-                end = max(end, known_end)
-        new_ranges.append((start, end))
-        ranges = new_ranges
-    return sum(end - start + 1 for start, end in ranges)
-
-
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
+    assert part_1(parse(example.database)) == example.fresh_ingredients
+
+
+def test_is_fresh() -> None:
+    fresh, ingredients = parse(EXAMPLE_DATABASE)
+    assert [ingredient in fresh for ingredient in ingredients] == fresh.contains_many(ingredients)
+
+
+def part_2(database: DatabaseType) -> int:
+    fresh, _ = database
+    return fresh.total_length()
+
+
+@parametrize("example", EXAMPLES_PART_2)
 def test_part_2(example: Example) -> None:
-    assert part_2(example.database) == example.fresh_ingredients
+    assert part_2(parse(example.database)) == example.fresh_ingredients
+
+
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # `size` fresh ranges and 5 * `size` ingredients
+    rng = random.Random(seed)
+    fresh_ranges: list[str] = []
+    for _ in range(size):
+        first_id = rng.randint(1, 10**15)
+        fresh_ranges.append(f"{first_id}-{first_id + rng.randint(0, 10**12)}")
+    ingredients = [str(rng.randint(1, 10**15)) for _ in range(5 * size)]
+    return "\n".join(fresh_ranges) + "\n\n" + "\n".join(ingredients) + "\n"
+
+
+def puzzle_input() -> list[str]:
+    return puzzle_input_as_list(ignore_empty_lines=False)
 
 
 def main():
+    database = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_list(ignore_empty_lines=False))}")  # 885
-    print(f"- Part 2: {part_2(puzzle_input_as_list(ignore_empty_lines=False))}")  # 348115621205535
+    print(f"- Part 1: {part_1(database)}")  # 885
+    print(f"- Part 2: {part_2(database)}")  # 348115621205535
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
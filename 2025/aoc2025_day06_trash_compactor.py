@@ -2,12 +2,12 @@
 """Advent of Code 2025 - Day 6: Trash Compactor (https://adventofcode.com/2025/day/6)"""
 
 import math
+import random
+from array import array
 from dataclasses import dataclass
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Iterator
 
-import pytest
-
-from aoc import puzzle_input_as_list
+from aoc import parametrize, puzzle_input_as_list, run_tests
 
 
 @dataclass
@@ -34,43 +34,92 @@ class Example:
 }
 
 
-def part_1(worksheet: list[str]) -> int:
-    rows = list(row.split() for row in worksheet)
-    grand_total = 0
-    for operation, numbers in zip(rows[-1], zip(*rows[:-1])):
-        grand_total += OPERATIONS[operation](map(int, numbers))
-    return grand_total
+COLUMN_USED = bytes(0 if char == ord(" ") else 1 for char in range(256))
+
+# number rows (padded to the same width), operation of every problem, start and end column of every problem
+type WorksheetType = tuple[list[bytes], str, array]
+type ProblemType = tuple[str, list[memoryview]]  # operation and number rows
+
+
+def parse(worksheet: list[str]) -> WorksheetType:
+    # Problems are separated by columns which are blank in all rows. The blank columns are found in a single pass:
+    # every row is translated to 0 (blank) / 1 (used) per column and OR-ed (as one big int). Only the column
+    # offsets of the problems are stored, the rows themselves are kept as they are.
+    width = max(len(row) for row in worksheet)
+    rows = [row.ljust(width).encode("ascii") for row in worksheet]
+    used_columns = 0
+    for row in rows:
+        used_columns |= int.from_bytes(row.translate(COLUMN_USED), "big")
+    columns = used_columns.to_bytes(width, "big")
+    operations = bytearray()
+    bounds = array("q")
+    start = 0
+    while start < width:
+        end = columns.find(0, start)
+        if end == -1:
+            end = width
+        if end > start:
+            operations.extend(rows[-1][start:end].strip())
+            bounds.extend((start, end))
+        start = end + 1
+    return rows[:-1], operations.decode("ascii"), bounds
+
 
+def problems(worksheet: WorksheetType) -> Iterator[ProblemType]:
+    # problems one at a time, the number rows are memoryview slices (no copies)
+    rows, operations, bounds = worksheet
+    views = [memoryview(row) for row in rows]
+    for operation, start, end in zip(operations, bounds[0::2], bounds[1::2]):
+        yield operation, [view[start:end] for view in views]
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+
+def part_1(worksheet: WorksheetType) -> int:
+    return sum(OPERATIONS[operation](map(int, number_rows)) for operation, number_rows in problems(worksheet))
+
+
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.worksheet) == example.grand_total
+    assert part_1(parse(example.worksheet)) == example.grand_total
 
 
-def part_2(worksheet: list[str]) -> int:
-    rows = list(row.split() for row in worksheet)
-    widths = [max(len(s) for s in problem) for problem in zip(*rows)]
-    idx = 0
+def part_2(worksheet: WorksheetType) -> int:
     grand_total = 0
-    for operation, width in zip(rows[-1], widths):
-        problem_numbers_by_row = [row[idx : idx + width] for row in worksheet[:-1]]
-        numbers = [int("".join(col)) for col in zip(*problem_numbers_by_row)]
-        grand_total += OPERATIONS[operation](numbers)
-        idx += width + 1
+    for operation, number_rows in problems(worksheet):
+        number_columns = (bytes(column) for column in zip(*number_rows))
+        grand_total += OPERATIONS[operation](map(int, number_columns))
     return grand_total
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
+@parametrize("example", EXAMPLES_PART_2)
 def test_part_2(example: Example) -> None:
-    assert part_2(example.worksheet) == example.grand_total
+    assert part_2(parse(example.worksheet)) == example.grand_total
+
+
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # `size` problems of 4 numbers
+    rng = random.Random(seed)
+    columns: list[list[str]] = []
+    for _ in range(size):
+        width = rng.randint(1, 4)
+        numbers = [str(rng.randint(10 ** (width - 1), 10**width - 1))]
+        numbers.extend(str(rng.randint(1, 10**width - 1)) for _ in range(3))
+        numbers.sort(key=len, reverse=True)  # no gaps within the digits of a column
+        align = str.rjust if rng.random() < 0.5 else str.ljust
+        columns.append([align(number, width) for number in numbers] + [rng.choice("+*").ljust(width)])
+    return "".join(" ".join(column[row] for column in columns) + "\n" for row in range(5))
+
+
+def puzzle_input() -> list[str]:
+    return puzzle_input_as_list(strip_lines=False)  # keep the alignment of the columns
 
 
 def main():
+    worksheet = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_list())}")  # 3785892992137
-    print(f"- Part 2: {part_2(puzzle_input_as_list())}")  # 7669802156452
+    print(f"- Part 1: {part_1(worksheet)}")  # 3785892992137
+    print(f"- Part 2: {part_2(worksheet)}")  # 7669802156452
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """Advent of Code 2025 - Day 7: Laboratories (https://adventofcode.com/2025/day/7)"""
 
+import random
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
-import pytest
-
-from aoc import puzzle_input_as_list
+from aoc import parametrize, puzzle_input_lines, run_tests
 
 
 @dataclass
@@ -39,54 +39,95 @@ class Example:
 EXAMPLES_PART_2 = [Example(DIAGRAM, 40)]
 
 
-def part_1(diagram: list[str]) -> int:
+SPLITTERS_AS_BITS = str.maketrans({"^": "1", ".": "0", "S": "0"})
+
+
+type ManifoldType = tuple[int, int, list[int]]  # width, start column and splitter rows (as bits)
+
+
+def splitter_bits(line: str) -> int:
+    # bit i is set when there is a splitter in column i
+    return int(line.translate(SPLITTERS_AS_BITS)[::-1], 2)
+
+
+def parse(diagram: Iterable[str]) -> ManifoldType:
+    # the (streamed) diagram is kept as one bit mask per row: width / 8 bytes per row instead of a string of width
+    # characters, rows without splitters don't change the beams and are left out
+    lines = iter(diagram)
+    first_line = next(lines)
+    return len(first_line), first_line.find("S"), [splitters for line in lines if (splitters := splitter_bits(line))]
+
+
+def part_1(manifold: ManifoldType) -> int:
+    # the beam front is a bitset (bit i is set for a beam in column i), all splits of a row at once
+    _, start, splitter_rows = manifold
+    beam_front = 1 << start
     splits = 0
-    current_beams: set[int] = {diagram[0].find("S")}
-    for line in diagram[1:]:
-        new_beams: set[int] = set()
-        splitters = [index for index, char in enumerate(line) if char == "^"]
-        for beam in current_beams:
-            if beam in splitters:
-                new_beams.update([beam - 1, beam + 1])
-                splits += 1
-            else:
-                new_beams.add(beam)
-        current_beams = new_beams
+    for splitters in splitter_rows:
+        if hits := beam_front & splitters:
+            splits += hits.bit_count()
+            beam_front = (beam_front ^ hits) | (hits << 1) | (hits >> 1)
     return splits
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.diagram) == example.answer
-
-
-def part_2(diagram: list[str]) -> int:
-    data = [1 for _ in diagram[0]]
-    for row in diagram[::-1]:
-        new_data: list[int] = []
-        for i, c in enumerate(row):
-            match c:
-                case "S":
-                    return data[i]
-                case "^":
-                    new_data.append(data[i - 1] + data[i + 1])
-                case _:
-                    new_data.append(data[i])
-        data = new_data
-    return -1
-
-
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
+    assert part_1(parse(example.diagram)) == example.answer
+
+
+def part_2(manifold: ManifoldType) -> int:
+    # timelines are counted per column, only the columns of the hits (the beam front bitset) are updated
+    width, start, splitter_rows = manifold
+    beam_front = 1 << start
+    timelines = [0] * (width + 1)
+    timelines[start] = 1
+    for splitters in splitter_rows:
+        hits = beam_front & splitters
+        if not hits:
+            continue
+        beam_front = (beam_front ^ hits) | (hits << 1) | (hits >> 1)
+        split_timelines: list[tuple[int, int]] = []  # take all of them first (adjacent splitters)
+        while hits:
+            hit = hits & -hits
+            hits ^= hit
+            column = hit.bit_length() - 1
+            split_timelines.append((column, timelines[column]))
+            timelines[column] = 0
+        for column, column_timelines in split_timelines:
+            timelines[column - 1] += column_timelines
+            timelines[column + 1] += column_timelines
+    return sum(timelines)
+
+
+@parametrize("example", EXAMPLES_PART_2)
 def test_part_2(example: Example) -> None:
-    assert part_2(example.diagram) == example.answer
+    assert part_2(parse(example.diagram)) == example.answer
+
+
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # diagram of `size` columns and `size` rows
+    rng = random.Random(seed)
+    lines = ["".join("S" if col == size // 2 else "." for col in range(size))]
+    for row in range(1, size):
+        # splitters on every other row, never at the edges
+        if row % 2:
+            lines.append("." * size)
+        else:
+            lines.append("".join("^" if 0 < col < size - 1 and rng.random() < 0.3 else "." for col in range(size)))
+    return "".join(line + "\n" for line in lines)
+
+
+def puzzle_input() -> Iterator[str]:
+    return puzzle_input_lines()
 
 
 def main():
+    manifold = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_list())}")  # 1658
-    print(f"- Part 2: {part_2(puzzle_input_as_list())}")  # 53916299384254
+    print(f"- Part 1: {part_1(manifold)}")  # 1658
+    print(f"- Part 2: {part_2(manifold)}")  # 53916299384254
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
@@ -3,11 +3,15 @@
 
 import itertools
 import math
+import random
+from array import array
 from dataclasses import dataclass
+from typing import Iterator
 
-import pytest
+from aoc import DisjointSet, KdTree, SpatialIndex, extract_ints, parametrize, puzzle_input_as_list, run_tests
 
-from aoc import puzzle_input_as_list
+NUMBER_CONNECTIONS = 1000
+SHORTEST_PAIRS_PER_BOX = 4  # connections (per box) taken in order of distance before building the rest of the tree
 
 
 @dataclass
@@ -44,84 +48,99 @@ class Example:
 EXAMPLES_PART_2 = [Example(EXAMPLE_BOXES, 25272)]
 
 
-@dataclass
-class Box:
-    position: tuple[int, int, int]
-    circuit: int
+type PositionsType = tuple[array, array, array]  # x, y and z coordinates of the boxes (struct of arrays)
+type EdgeType = tuple[int, int, int]  # squared distance, box number, box number
 
 
-type BoxesType = list[Box]
-type CircuitsType = dict[int, set[int]]
+def parse(positions_list: list[str]) -> PositionsType:
+    coordinates = extract_ints("\n".join(positions_list))
+    return coordinates[0::3], coordinates[1::3], coordinates[2::3]
 
 
-def parse_positions_list(positions_list: list[str]) -> tuple[BoxesType, CircuitsType]:
-    boxes: BoxesType = []
-    circuits: CircuitsType = {}
-    for box_nr, row in enumerate(positions_list):
-        x, y, z = map(int, row.split(","))
-        boxes.append(Box((x, y, z), box_nr))
-        circuits[box_nr] = set([box_nr])
-    return boxes, circuits
+def edges(positions: PositionsType) -> Iterator[EdgeType]:
+    # edges in order of distance (generated on demand, callers typically stop long before the last edge)
+    return SpatialIndex(*positions).pairs_by_distance()
 
 
-def squared_euclidean_distance(b1: Box, b2: Box) -> int:
-    # omit the SQRT (not needed for comparison)
-    return (
-        (b1.position[0] - b2.position[0]) ** 2
-        + (b1.position[1] - b2.position[1]) ** 2
-        + (b1.position[2] - b2.position[2]) ** 2
+@parametrize("seed", range(5))
+def test_edges(seed: int) -> None:
+    positions = parse(generate_puzzle_input(60, seed).splitlines() + EXAMPLE_BOXES[:5] * 2)  # with duplicate boxes
+    xs, ys, zs = positions
+    all_edges = sorted(
+        ((xs[nr1] - xs[nr2]) ** 2 + (ys[nr1] - ys[nr2]) ** 2 + (zs[nr1] - zs[nr2]) ** 2, nr1, nr2)
+        for nr1, nr2 in itertools.combinations(range(len(xs)), 2)
     )
+    assert list(edges(positions)) == all_edges
 
 
-def connect_circuits(boxes: BoxesType, circuits: CircuitsType, b1: Box, b2: Box) -> tuple[BoxesType, CircuitsType]:
-    if b1.circuit != b2.circuit:
-        new_circuit, old_circuit = b1.circuit, b2.circuit
-        for box_nr in circuits[old_circuit]:
-            boxes[box_nr].circuit = new_circuit
-        circuits[new_circuit] |= circuits[old_circuit]
-        del circuits[old_circuit]
-    return boxes, circuits  # strictly not required (pass by reference), but let's make it obvious
-
-
-def part_1(positions_list: list[str], number_connections: int) -> int:
-    boxes, circuits = parse_positions_list(positions_list)
-    distances = sorted([(squared_euclidean_distance(b1, b2), b1, b2) for b1, b2 in itertools.combinations(boxes, 2)])
-
-    for _, b1, b2 in distances[:number_connections]:
-        boxes, circuits = connect_circuits(boxes, circuits, b1, b2)
+def part_1(positions: PositionsType, number_connections: int = NUMBER_CONNECTIONS) -> int:
+    circuits = DisjointSet(len(positions[0]))
+    for _, nr1, nr2 in itertools.islice(edges(positions), number_connections):
+        circuits.union(nr1, nr2)
+    return math.prod(circuits.largest(3))
 
-    three_largest_circuit_sizes = sorted([len(circuit) for circuit in circuits.values()], reverse=True)[:3]
-    return math.prod(three_largest_circuit_sizes)
 
-
-@pytest.mark.parametrize("example", EXAMPLES_PART_1)
+@parametrize("example", EXAMPLES_PART_1)
 def test_part_1(example: Example) -> None:
-    assert part_1(example.positions_list, 10) == example.answer
+    assert part_1(parse(example.positions_list), 10) == example.answer
+
+
+def part_2(positions: PositionsType, shortest_pairs_per_box: int = SHORTEST_PAIRS_PER_BOX) -> int:
+    # taking connections (in order of distance) until everything is connected, the last one is the longest edge of
+    # the minimum spanning tree (in order of distance and box numbers): take the shortest connections (cheap for
+    # evenly spread boxes) and build the rest of the tree directly (Borůvka, e.g. far apart clusters of boxes)
+    xs, circuits = positions[0], DisjointSet(len(positions[0]))
+    for _, nr1, nr2 in itertools.islice(edges(positions), shortest_pairs_per_box * len(xs)):
+        if circuits.union(nr1, nr2) and circuits.count == 1:
+            return xs[nr1] * xs[nr2]
+    tree_edges = KdTree(*positions).minimum_spanning_tree(circuits)
+    if not tree_edges:
+        return -1  # nothing to connect, but make sure we always return an int
+    _, nr1, nr2 = tree_edges[-1]
+    return xs[nr1] * xs[nr2]
+
+
+@parametrize("seed", range(5))
+def test_minimum_spanning_tree(seed: int) -> None:
+    rng = random.Random(seed)
+    clusters = [  # two clusters far apart
+        f"{x + rng.randrange(50)},{rng.randrange(50)},{rng.randrange(50)}" for x in (0, 90000) for _ in range(40)
+    ]
+    positions_list = generate_puzzle_input(60, seed).splitlines() + EXAMPLE_BOXES[:5] * 2 + clusters  # with duplicates
+    xs, ys, zs = positions = parse(positions_list)
+    all_edges = sorted(
+        ((xs[nr1] - xs[nr2]) ** 2 + (ys[nr1] - ys[nr2]) ** 2 + (zs[nr1] - zs[nr2]) ** 2, nr1, nr2)
+        for nr1, nr2 in itertools.combinations(range(len(xs)), 2)
+    )
+    circuits = DisjointSet(len(xs))
+    kruskal_edges = [edge for edge in all_edges if circuits.union(edge[1], edge[2])]
+    assert KdTree(*positions).minimum_spanning_tree() == kruskal_edges
+    _, nr1, nr2 = kruskal_edges[-1]
+    assert part_2(positions, 1) == xs[nr1] * xs[nr2]  # the shortest connections, then the rest of the tree
 
 
-def part_2(positions_list: list[str]) -> int:
-    boxes, circuits = parse_positions_list(positions_list)
-    distances = sorted([(squared_euclidean_distance(b1, b2), b1, b2) for b1, b2 in itertools.combinations(boxes, 2)])
+@parametrize("example", EXAMPLES_PART_2)
+def test_part_2(example: Example) -> None:
+    assert part_2(parse(example.positions_list)) == example.answer
 
-    for _, b1, b2 in distances:
-        boxes, circuits = connect_circuits(boxes, circuits, b1, b2)
-        if len(circuits) == 1:
-            return b1.position[0] * b2.position[0]
 
-    return -1  # should never be reached, but make sure we always return an int
+def generate_puzzle_input(size: int, seed: int = 0) -> str:
+    # `size` junction boxes
+    rng = random.Random(seed)
+    return "".join(f"{rng.randrange(100000)},{rng.randrange(100000)},{rng.randrange(100000)}\n" for _ in range(size))
 
 
-@pytest.mark.parametrize("example", EXAMPLES_PART_2)
-def test_part_2(example: Example) -> None:
-    assert part_2(example.positions_list) == example.answer
+def puzzle_input() -> list[str]:
+    return puzzle_input_as_list()
 
 
 def main():
+    positions = parse(puzzle_input())
     print("Solution:")
-    print(f"- Part 1: {part_1(puzzle_input_as_list(), 1000)}")  # 67488
-    print(f"- Part 2: {part_2(puzzle_input_as_list())}")  # 3767453340
+    print(f"- Part 1: {part_1(positions)}")  # 67488
+    print(f"- Part 2: {part_2(positions)}")  # 3767453340
 
 
 if __name__ == "__main__":
-    pytest.main(["-vv", __file__])
+    run_tests(__file__)
     main()
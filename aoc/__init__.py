@@ -1,28 +1,136 @@
 """Advent of Code - utilities"""
 
+import io
+import mmap
+import re
+import sys
 import time
-import traceback
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, ParamSpec, TypeVar
+from types import ModuleType
+from typing import Callable, Iterator, ParamSpec, TypeVar
+
+from aoc.benchmark import Benchmark, BenchmarkResult, results_as_csv, results_as_json
+from aoc.bit_grid import BitGrid
+from aoc.disjoint_set import DisjointSet
+from aoc.grid import Grid
+from aoc.interval_set import IntervalSet
+from aoc.kd_tree import KdTree
+from aoc.profiling import profiled
+from aoc.spatial_index import SpatialIndex
+from aoc.testing import parametrize, run_tests
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "BitGrid",
+    "CallerType",
+    "DEFAULT_DATA_DIR",
+    "DisjointSet",
+    "Grid",
+    "InputFileNotFoundException",
+    "IntervalSet",
+    "KdTree",
+    "PROJECT_ROOT",
+    "PUZZLE_INPUT_CACHE_MAX_SIZE",
+    "SpatialIndex",
+    "clear_puzzle_input_cache",
+    "extract_ints",
+    "get_puzzle_input_filename",
+    "measure_duration",
+    "parametrize",
+    "profiled",
+    "puzzle_input_as_list",
+    "puzzle_input_as_str",
+    "puzzle_input_lines",
+    "read_puzzle_input",
+    "results_as_csv",
+    "results_as_json",
+    "run_tests",
+    "use_data_dir",
+]
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 DEFAULT_DATA_DIR = "data"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PUZZLE_INPUT_CACHE_MAX_SIZE = 64 * 1024 * 1024  # maximum number of cached characters
+
+type CallerType = str | Path | ModuleType
+
+SIGNED_INT_BYTES_RE = re.compile(rb"(?<!\d)-?\d+")  # a minus directly after a digit is a separator (e.g. "3-5")
+# bytes.translate() tables keeping the digits (and the minus sign), everything else becomes a space
+UNSIGNED_INT_TABLE = bytes(byte if chr(byte) in "0123456789" else ord(" ") for byte in range(256))
+SIGNED_INT_TABLE = bytes(byte if chr(byte) in "-0123456789" else ord(" ") for byte in range(256))
+
+_puzzle_input_files: dict[tuple[str, str], Path] = {}  # resolved puzzle input files (only the ones found)
+# expected puzzle input files (existing or not), None for source files outside PROJECT_ROOT (never have one)
+_expected_puzzle_input_files: dict[tuple[str, str], Path | None] = {}
+_puzzle_input_cache: OrderedDict[tuple[Path, int, int], str] = OrderedDict()  # (path, mtime (ns), size): content
+_puzzle_input_cache_size = 0  # pylint: disable=invalid-name
+_data_dir = DEFAULT_DATA_DIR  # pylint: disable=invalid-name
 
 
 class InputFileNotFoundException(Exception):
     """Input file not found"""
 
 
-def get_puzzle_input_filename(data_dir: str | Path | None = None) -> Path:
+def _puzzle_input_filename_for(filename: str, data_dir: str) -> Path | None:
+    """Resolve the puzzle input file for a single source file (memoized when found).
+
+    A missing file is looked up again on the next call, so puzzle input
+    downloaded later (e.g. in a long-lived process) is picked up. Where the
+    file is expected is memoized either way: a miss costs a single stat, and
+    nothing at all for source files outside PROJECT_ROOT (e.g. the standard
+    library and pytest on the call stack).
+
+    Args:
+        filename (str): source file name (as found in a code object or __file__).
+        data_dir (str): base name of the data directory.
+
+    Returns:
+        Path | None: puzzle input file or None when the source file has none
+    """
+    key = (filename, data_dir)
+    puzzle_input_file = _puzzle_input_files.get(key)
+    if puzzle_input_file is not None:
+        return puzzle_input_file
+    if key not in _expected_puzzle_input_files:
+        resolved = Path(filename).resolve()
+        _expected_puzzle_input_files[key] = (
+            PROJECT_ROOT / data_dir / resolved.relative_to(PROJECT_ROOT).with_suffix(".txt")
+            if resolved.is_relative_to(PROJECT_ROOT)
+            else None
+        )
+    puzzle_input_file = _expected_puzzle_input_files[key]
+    if puzzle_input_file is None or not puzzle_input_file.exists():
+        return None
+    _puzzle_input_files[key] = puzzle_input_file
+    return puzzle_input_file
+
+
+def _caller_filenames() -> list[str]:
+    """Get the source file names on the call stack (outermost first, duplicates removed)."""
+    filenames: dict[str, None] = {}
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None:
+        filenames[frame.f_code.co_filename] = None
+        frame = frame.f_back
+    return list(filenames)[::-1]
+
+
+def get_puzzle_input_filename(data_dir: str | Path | None = None, caller: CallerType | None = None) -> Path:
     """Generate a filename where the puzzle input is expected.
 
     The file to be found is based on the name of the caller script (which is
-    retrieved from the call stack). The puzzle input file must have the same
-    name as the caller (but with .txt extension) and be located in a folder
-    'data' below the project root folder. The folder structure below 'data'
-    must be comparable to the location of the caller script, e.g.:
+    retrieved from the call stack, unless given explicitly). The puzzle input
+    file must have the same name as the caller (but with .txt extension) and
+    be located in a folder 'data' below the project root folder. The folder
+    structure below 'data' must be comparable to the location of the caller
+    script, e.g.:
       project_root
        ├─► aoc
        │    └─► __init__.py        this file (__file__)
@@ -35,9 +143,18 @@ def get_puzzle_input_filename(data_dir: str | Path | None = None) -> Path:
     This example shows one level above the caller, but multiple levels are
     supported as well.
 
+    Resolution is memoized per source file, so repeated calls only walk the
+    frame objects and do a dictionary lookup per frame (plus a stat for
+    source files in the project without puzzle input). Passing the caller
+    (e.g. `__file__` or a module) skips the stack walk altogether.
+
     Args:
         data_dir (str | Path | None, optional): base name of the data
-            directory. Defaults to DEFAULT_DATA_DIR.
+            directory. Defaults to DEFAULT_DATA_DIR (or the one selected
+            with use_data_dir()).
+        caller (str | Path | ModuleType | None, optional): source file or
+            module to find the puzzle input for. Defaults to None (walk the
+            call stack).
 
     Raises:
         InputFileNotFoundException: when no file was found
@@ -45,52 +162,193 @@ def get_puzzle_input_filename(data_dir: str | Path | None = None) -> Path:
     Returns:
         Path: content puzzle input file
     """
-    project_root = str(Path(__file__).resolve().parent.parent)
-    data_dir = str(data_dir) if data_dir is not None else DEFAULT_DATA_DIR
-    for stack_frame in traceback.extract_stack():
-        filename = str(Path(stack_frame.filename).resolve())
-        if filename.startswith(project_root):
-            file_in_subtree = Path(filename[len(project_root) + 1 :])
-            puzzle_input_file = Path(project_root) / data_dir / file_in_subtree.with_suffix(".txt")
-            if puzzle_input_file.exists():
-                return puzzle_input_file
+    data_dir = str(data_dir) if data_dir is not None else _data_dir
+    if caller is not None:
+        filenames = [str(caller.__file__ if isinstance(caller, ModuleType) else caller)]
+    else:
+        filenames = _caller_filenames()
+    for filename in filenames:
+        puzzle_input_file = _puzzle_input_filename_for(filename, data_dir)
+        if puzzle_input_file is not None:
+            return puzzle_input_file
     raise InputFileNotFoundException("could not find puzzle input file")
 
 
-def puzzle_input_as_list(ignore_empty_lines: bool = True) -> list[str]:
+def read_puzzle_input(puzzle_input_file: Path) -> str:
+    """Read a puzzle input file through a size bounded (LRU) content cache.
+
+    Cached content is keyed by the path, modification time and size of the
+    file, so a file changed on disk is read again.
+
+    Args:
+        puzzle_input_file (Path): puzzle input file to read.
+
+    Returns:
+        str: content puzzle input file
+    """
+    global _puzzle_input_cache_size  # pylint: disable=global-statement
+    stat = puzzle_input_file.stat()
+    key = (puzzle_input_file, stat.st_mtime_ns, stat.st_size)
+    content = _puzzle_input_cache.get(key)
+    if content is not None:
+        _puzzle_input_cache.move_to_end(key)
+        return content
+    for stale_key in [cached_key for cached_key in _puzzle_input_cache if cached_key[0] == puzzle_input_file]:
+        _puzzle_input_cache_size -= len(_puzzle_input_cache.pop(stale_key))
+    content = puzzle_input_file.read_text(encoding="utf-8")
+    if len(content) <= PUZZLE_INPUT_CACHE_MAX_SIZE:
+        _puzzle_input_cache[key] = content
+        _puzzle_input_cache_size += len(content)
+        while _puzzle_input_cache_size > PUZZLE_INPUT_CACHE_MAX_SIZE:
+            _, evicted = _puzzle_input_cache.popitem(last=False)
+            _puzzle_input_cache_size -= len(evicted)
+    return content
+
+
+def clear_puzzle_input_cache() -> None:
+    """Forget all resolved puzzle input file names and cached puzzle input."""
+    global _puzzle_input_cache_size  # pylint: disable=global-statement
+    _puzzle_input_files.clear()
+    _expected_puzzle_input_files.clear()
+    _puzzle_input_cache.clear()
+    _puzzle_input_cache_size = 0
+
+
+@contextmanager
+def use_data_dir(data_dir: str | Path) -> Iterator[None]:
+    """Temporarily read puzzle input from another data directory (e.g. with synthetic input).
+
+    Args:
+        data_dir (str | Path): data directory, relative to the project root or absolute.
+    """
+    global _data_dir  # pylint: disable=global-statement
+    previous_data_dir, _data_dir = _data_dir, str(data_dir)
+    try:
+        yield
+    finally:
+        _data_dir = previous_data_dir
+
+
+def puzzle_input_as_list(
+    ignore_empty_lines: bool = True, caller: CallerType | None = None, strip_lines: bool = True
+) -> list[str]:
     """Read puzzle input file, (optionally) suppress empty lines and return as list.
 
     Args:
         ignore_empty_lines (bool, optional): suppress empty lines (default: True).
+        caller (str | Path | ModuleType | None, optional): source file or
+            module to find the puzzle input for (default: walk the call stack).
+        strip_lines (bool, optional): strip leading and trailing whitespace
+            from lines (default: True), lines with only whitespace are
+            considered empty either way.
 
     Yields:
         list[str]: list of puzzle input file lines
     """
-    puzzle_input: list[str] = []
-    with open(get_puzzle_input_filename(), encoding="utf-8") as fh_in:
-        for line in fh_in:
-            line = line.strip()
-            if ignore_empty_lines and not line:
-                continue
-            puzzle_input.append(line)
-    return puzzle_input
+    lines = read_puzzle_input(get_puzzle_input_filename(caller=caller)).split("\n")
+    if lines[-1] == "":
+        lines.pop()  # a trailing newline does not start a new line
+    if strip_lines:
+        lines = [line.strip() for line in lines]
+    if ignore_empty_lines:
+        lines = [line for line in lines if line and not line.isspace()]
+    return lines
+
+
+def _file_lines(puzzle_input_file: Path, buffer_size: int) -> Iterator[str]:
+    with open(puzzle_input_file, encoding="utf-8", buffering=buffer_size) as fh_in:
+        yield from fh_in
+
+
+def _mmap_lines(puzzle_input_file: Path) -> Iterator[str]:
+    with open(puzzle_input_file, "rb") as fh_in:
+        if puzzle_input_file.stat().st_size == 0:
+            return  # an empty file cannot be mapped
+        with mmap.mmap(fh_in.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from (line.decode("utf-8") for line in iter(mm.readline, b""))
+
+
+def puzzle_input_lines(
+    ignore_empty_lines: bool = True,
+    caller: CallerType | None = None,
+    use_mmap: bool = False,
+    buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+) -> Iterator[str]:
+    """Lazily read the puzzle input file line by line (stripped).
+
+    The file is read while iterating, so (unlike puzzle_input_as_list()) memory
+    usage does not depend on the size of the puzzle input. The puzzle input
+    file is resolved when called (not on first iteration), so the result can
+    be consumed anywhere.
+
+    Args:
+        ignore_empty_lines (bool, optional): suppress empty lines (default: True).
+        caller (str | Path | ModuleType | None, optional): source file or
+            module to find the puzzle input for (default: walk the call stack).
+        use_mmap (bool, optional): read through a memory mapped file instead of
+            a buffered file (default: False).
+        buffer_size (int, optional): buffer size of the buffered file (default:
+            io.DEFAULT_BUFFER_SIZE), not used for memory mapped files.
+
+    Returns:
+        Iterator[str]: iterator over the puzzle input file lines
+    """
+    puzzle_input_file = get_puzzle_input_filename(caller=caller)
+    lines = _mmap_lines(puzzle_input_file) if use_mmap else _file_lines(puzzle_input_file, buffer_size)
+    stripped_lines = (line.strip() for line in lines)
+    if ignore_empty_lines:
+        return (line for line in stripped_lines if line)
+    return stripped_lines
 
 
-def puzzle_input_as_str() -> str:
+def puzzle_input_as_str(caller: CallerType | None = None) -> str:
     """Get the puzzle input as a string.
 
+    Args:
+        caller (str | Path | ModuleType | None, optional): source file or
+            module to find the puzzle input for (default: walk the call stack).
+
     Returns:
         str: content puzzle input file
     """
-    return get_puzzle_input_filename().read_text(encoding="utf-8")
+    return read_puzzle_input(get_puzzle_input_filename(caller=caller))
+
+
+def extract_ints(data: str | bytes, signed: bool = True) -> array:
+    """Extract all integers from (raw) puzzle input in a single pass.
+
+    A minus sign is part of an integer unless it directly follows a digit, so
+    ranges like "3-5" are two (positive) integers. Everything but digits (and
+    minus signs) is translated to whitespace in bulk and the result is split,
+    only when a minus sign ends up in the middle of a word (e.g. "3-5") the
+    input is scanned with a regex instead.
+
+    Args:
+        data (str | bytes): puzzle input.
+        signed (bool, optional): recognize negative integers (default: True).
+
+    Returns:
+        array: integers as int64 array
+    """
+    raw = data.encode("utf-8") if isinstance(data, str) else data
+    words = raw.translate(SIGNED_INT_TABLE if signed else UNSIGNED_INT_TABLE).decode("ascii").split()
+    try:
+        return array("q", map(int, words))
+    except ValueError:  # (signed only) a minus sign after a digit or without digits
+        return array("q", map(int, SIGNED_INT_BYTES_RE.findall(raw)))
 
 
 def measure_duration(func: Callable[P, R]) -> Callable[P, R]:
-    """Decorator to measure the duration of a function call."""
+    """Decorator to measure the duration of a function call.
+
+    This takes a single sample, use Benchmark for statistically sound timings.
+    The function is profiled when requested (see aoc.profiling).
+    """
+    profiled_func = profiled(func)
 
     def wrap_func(*args: P.args, **kwargs: P.kwargs) -> R:
         t1 = time.perf_counter()
-        result = func(*args, **kwargs)
+        result = profiled_func(*args, **kwargs)
         t2 = time.perf_counter()
         print(f"{func.__name__}(): {(t2 - t1):.4f}s")
         return result
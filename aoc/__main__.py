@@ -0,0 +1,77 @@
+"""Advent of Code - command line interface
+
+Usage:
+    python -m aoc run 2025 --days 1-8 --jobs 4
+    python -m aoc bench 2025 --days 1-8 --threshold 0.2
+    python -m aoc scale 2025 --days 4,8 --sizes 100,200,400,800
+    python -m aoc importtime 2025 --days 1,3,6
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from aoc import importtime, regression, runner, scaling
+from aoc.profiling import PROFILERS
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Advent of Code solutions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run solutions and report answers and timings")
+    run_parser.add_argument("year", type=int, help="year of the puzzles, e.g. 2025")
+    run_parser.add_argument("--days", help='days to run, e.g. "1-3,5" (default: all days)')
+    run_parser.add_argument("--jobs", type=int, help="number of worker processes (default: number of CPUs)")
+    run_parser.add_argument("--profile", choices=PROFILERS, help="profile every part (files in 'profiles')")
+    run_parser.add_argument("--no-cache", action="store_true", help="recalculate all answers (ignore the answer cache)")
+
+    bench_parser = subparsers.add_parser("bench", help="benchmark solutions and compare with the stored baseline")
+    bench_parser.add_argument("year", type=int, help="year of the puzzles, e.g. 2025")
+    bench_parser.add_argument("--days", help='days to run, e.g. "1-3,5" (default: all days)')
+    bench_parser.add_argument("--repeat", type=int, default=5, help="measured runs per part (default: 5)")
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=regression.DEFAULT_THRESHOLD,
+        help=f"allowed slowdown relative to the baseline (default: {regression.DEFAULT_THRESHOLD})",
+    )
+    bench_parser.add_argument(
+        "--history", type=Path, default=regression.DEFAULT_HISTORY_FILE, help="benchmark history (JSON) file"
+    )
+    bench_parser.add_argument("--no-save", action="store_true", help="don't add this run to the history")
+
+    scale_parser = subparsers.add_parser("scale", help="run solutions on synthetic input of increasing sizes")
+    scale_parser.add_argument("year", type=int, help="year of the puzzles, e.g. 2025")
+    scale_parser.add_argument("--days", help='days to run, e.g. "1-3,5" (default: all days)')
+    scale_parser.add_argument(
+        "--sizes",
+        type=lambda sizes: [int(size) for size in sizes.split(",")],
+        default=scaling.DEFAULT_SIZES,
+        help=f"comma separated input sizes (default: {','.join(map(str, scaling.DEFAULT_SIZES))})",
+    )
+    scale_parser.add_argument("--seed", type=int, default=0, help="seed of the input generators (default: 0)")
+    scale_parser.add_argument("--repeat", type=int, default=3, help="measured runs per part and size (default: 3)")
+
+    importtime_parser = subparsers.add_parser(
+        "importtime", help="report the import time of solutions (with and without pytest)"
+    )
+    importtime_parser.add_argument("year", type=int, help="year of the puzzles, e.g. 2025")
+    importtime_parser.add_argument("--days", help='days to run, e.g. "1-3,5" (default: all days)')
+    importtime_parser.add_argument("--top", type=int, default=5, help="number of most expensive imports (default: 5)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return runner.run(args.year, args.days, args.jobs, args.profile, not args.no_cache)
+    if args.command == "bench":
+        options = regression.BenchOptions(args.repeat, args.threshold, args.history, not args.no_save)
+        return regression.run(args.year, args.days, options)
+    if args.command == "scale":
+        return scaling.run(args.year, args.days, args.sizes, args.seed, args.repeat)
+    if args.command == "importtime":
+        return importtime.run(args.year, args.days, args.top)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
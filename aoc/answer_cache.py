@@ -0,0 +1,130 @@
+"""Advent of Code - on-disk cache of answers
+
+Answers are stored per part ("<year>/<day>/<part>") together with the hashes
+(SHA-256) of the solution source file and the puzzle input file they were
+computed from, and with the durations of the original run. An entry is only
+used when both hashes still match, otherwise it is stale and removed. The
+source hash covers the whole solution file (instead of only the part function)
+and the sources of the aoc package, so edits of helper functions in the
+solution file and of shared helpers (e.g. aoc.IntervalSet) invalidate the
+answers as well.
+"""
+
+import dataclasses
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from aoc import PROJECT_ROOT, InputFileNotFoundException, get_puzzle_input_filename
+from aoc.puzzle import Timings
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_FILE = PROJECT_ROOT / ".aoc_cache" / "answers.json"
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def package_hash() -> str:
+    """Hash of all sources of the aoc package (names and contents)."""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode() + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def source_hash(source_file: Path, aoc_hash: str) -> str:
+    """Hash of a solution file combined with the hash of the aoc package it depends on."""
+    return hashlib.sha256(f"{file_hash(source_file)}:{aoc_hash}".encode()).hexdigest()
+
+
+class AnswerCache:
+    """Answers of solution parts, keyed by part and validated by source and input hashes.
+
+    Example:
+        cache = AnswerCache.load()
+        entry = cache.lookup("2025/08/part_2", source_file)
+        if entry is None:
+            cache.store("2025/08/part_2", source_file, answer, Timings(input_duration, parse_duration, solve_duration))
+        cache.save()
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_FILE, entries: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self.entries = entries if entries is not None else {}
+        self.changed = False
+        self._hashes: dict[Path, tuple[str, str] | None] = {}
+        self._package_hash: str | None = None
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_CACHE_FILE) -> "AnswerCache":
+        """Load the cache (empty when the file doesn't exist or has another version)."""
+        try:
+            content = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if content.get("version") != CACHE_VERSION:
+            return cls(path)
+        return cls(path, content["entries"])
+
+    def save(self) -> None:
+        """Write the cache, when it was changed."""
+        if not self.changed:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        content = {"version": CACHE_VERSION, "entries": self.entries}
+        self.path.write_text(json.dumps(content, indent=2) + "\n", encoding="utf-8")
+        self.changed = False
+
+    def hashes(self, source_file: Path) -> tuple[str, str] | None:
+        """Hashes of the source (file and aoc package) and the puzzle input file (None when there's no input file).
+
+        The hashes are calculated once per cache instance (i.e. once per run).
+        """
+        if source_file not in self._hashes:
+            try:
+                puzzle_input_file = get_puzzle_input_filename(caller=source_file)
+            except InputFileNotFoundException:
+                self._hashes[source_file] = None
+            else:
+                if self._package_hash is None:
+                    self._package_hash = package_hash()
+                self._hashes[source_file] = source_hash(source_file, self._package_hash), file_hash(puzzle_input_file)
+        return self._hashes[source_file]
+
+    def lookup(self, key: str, source_file: Path) -> dict[str, Any] | None:
+        """Cached entry (answer, input_duration, parse_duration, solve_duration) or None, stale entries are removed."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if self.hashes(source_file) != (entry["source_hash"], entry["input_hash"]):
+            del self.entries[key]
+            self.changed = True
+            return None
+        return entry
+
+    def store(self, key: str, source_file: Path, answer: int | str, timings: Timings) -> None:
+        hashes = self.hashes(source_file)
+        if hashes is None:
+            return
+        self.entries[key] = {
+            "source_file": source_file.resolve().relative_to(PROJECT_ROOT).as_posix(),
+            "source_hash": hashes[0],
+            "input_hash": hashes[1],
+            "answer": answer,
+            **dataclasses.asdict(timings),  # input_duration, parse_duration and solve_duration
+        }
+        self.changed = True
+
+    def prune(self) -> None:
+        """Remove the entries of solutions which no longer exist."""
+        for key, entry in list(self.entries.items()):
+            if not (PROJECT_ROOT / entry["source_file"]).exists():
+                del self.entries[key]
+                self.changed = True
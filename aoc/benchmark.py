@@ -0,0 +1,161 @@
+"""Advent of Code - statistical benchmarking of (puzzle) functions"""
+
+import csv
+import gc
+import io
+import json
+import math
+import statistics
+import time
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Iterable, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_PERCENTILES = (5, 25, 75, 95)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Percentile of samples using linear interpolation between closest ranks.
+
+    Args:
+        samples (list[float]): samples (at least one).
+        pct (float): percentile (0..100).
+
+    Returns:
+        float: percentile of the samples
+    """
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    samples: list[float]
+    result: Any = field(default=None, repr=False)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def max(self) -> float:
+        return max(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def percentile(self, pct: float) -> float:
+        return percentile(self.samples, pct)
+
+    def as_dict(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, Any]:
+        """Summary of the benchmark (durations in seconds)."""
+        summary: dict[str, Any] = {
+            "name": self.name,
+            "runs": len(self.samples),
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "max": self.max,
+        }
+        for pct in percentiles:
+            summary[f"p{pct:g}"] = self.percentile(pct)
+        return summary
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}(): min {self.min:.6f}s, median {self.median:.6f}s, "
+            f"stddev {self.stddev:.6f}s, p95 {self.percentile(95):.6f}s ({len(self.samples)} runs)"
+        )
+
+
+def results_as_json(results: Iterable[BenchmarkResult], percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> str:
+    """Benchmark results as a JSON list of summaries."""
+    percentiles = tuple(percentiles)
+    return json.dumps([result.as_dict(percentiles) for result in results], indent=2)
+
+
+def results_as_csv(results: Iterable[BenchmarkResult], percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> str:
+    """Benchmark results as CSV (one row per result, with a header)."""
+    percentiles = tuple(percentiles)
+    rows = [result.as_dict(percentiles) for result in results]
+    output = io.StringIO()
+    if rows:
+        writer = csv.DictWriter(output, fieldnames=list(rows[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    return output.getvalue()
+
+
+@dataclass
+class Benchmark:
+    """Benchmark settings, usable as decorator or to run a function directly.
+
+    Every run starts with `warmup` runs which are not measured. After that
+    the function is run `repeat` times or, when a `time_budget` (in seconds) is
+    given, until the budget is spent (with a minimum of one run). Garbage
+    collection is disabled while measuring, unless `disable_gc` is False.
+
+    Example:
+        parsed = parse(puzzle_input_as_list())       # parse cost excluded
+        print(Benchmark(repeat=20).run(part_1, parsed))
+
+        @Benchmark(warmup=0, time_budget=2.0)        # prints a summary per call
+        def part_2(...): ...
+    """
+
+    warmup: int = 1
+    repeat: int = 10
+    time_budget: float | None = None
+    disable_gc: bool = True
+
+    def run(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> BenchmarkResult:
+        """Benchmark func(*args, **kwargs), the result of the last call is kept."""
+        result = None
+        for _ in range(self.warmup):
+            result = func(*args, **kwargs)
+        samples: list[float] = []
+        gc_was_enabled = gc.isenabled()
+        if self.disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            budget_end = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+            while True:
+                t1 = time.perf_counter()
+                result = func(*args, **kwargs)
+                t2 = time.perf_counter()
+                samples.append(t2 - t1)
+                if budget_end is not None:
+                    if t2 >= budget_end:
+                        break
+                elif len(samples) >= self.repeat:
+                    break
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return BenchmarkResult(func.__name__, samples, result)
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrap_func(*args: P.args, **kwargs: P.kwargs) -> R:
+            benchmark_result = self.run(func, *args, **kwargs)
+            print(benchmark_result)
+            return benchmark_result.result
+
+        return wrap_func
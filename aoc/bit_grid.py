@@ -0,0 +1,105 @@
+"""Advent of Code - 2-D grid of bits (bitboard)"""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from aoc.grid import Grid
+
+NEIGHBOR_COUNT_BITS = 4  # counts of 0..8 neighbors fit in 4 bits
+
+
+@dataclass(frozen=True)
+class BitGrid:
+    """2-D grid of bits stored as one arbitrary-precision int (bitboard).
+
+    Every row is a bit mask of `width` bits, rows are `stride` (width + 1)
+    bits apart: the extra (always clear) bit after every row makes sure
+    shifting a row left or right never moves bits into the next row. Bit
+    `row * stride + col` is cell (row, col). Operations on all cells at once
+    take a fixed number of big-int operations, regardless of the number of
+    cells that are set.
+    """
+
+    height: int
+    width: int
+    bits: int = 0
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], char: str = "#") -> "BitGrid":
+        """Create a grid from lines of text, the cells with `char` are set."""
+        rows = [line.encode("ascii") for line in lines]
+        width = len(rows[0]) if rows else 0
+        table = bytes(ord("1") if byte == ord(char) else ord("0") for byte in range(256))
+        # all rows (with the clear bit in between) as one binary number in a single conversion, reversed because
+        # int(..., 2) takes the first digit as most significant bit (and cell (0, 0) is the lowest bit)
+        digits = b"0".join(row.translate(table) for row in rows)
+        return cls(len(rows), width, int(digits[::-1] or b"0", 2))
+
+    @property
+    def stride(self) -> int:
+        return self.width + 1
+
+    @property
+    def mask(self) -> int:
+        """All cells of the grid set."""
+        row_starts = ((1 << (self.stride * self.height)) - 1) // ((1 << self.stride) - 1)  # bit 0 of every row
+        return row_starts * ((1 << self.width) - 1)
+
+    def __len__(self) -> int:
+        """Number of cells set."""
+        return self.bits.bit_count()
+
+    def __getitem__(self, position: tuple[int, int]) -> bool:
+        row, col = position
+        return bool(self.bits >> (row * self.stride + col) & 1)
+
+    def row(self, row: int) -> int:
+        """Row as bit mask (bit i is column i)."""
+        return self.bits >> (row * self.stride) & ((1 << self.width) - 1)
+
+    def to_grid(self) -> Grid:
+        """The grid as Grid with value 1 in the set cells (e.g. to update cells one at a time)."""
+        stride = self.stride
+        digits = format(self.bits, "b")[::-1].ljust(self.height * stride, "0")  # lowest bit (cell (0, 0)) first
+        rows = (digits[row * stride : row * stride + self.width] for row in range(self.height))
+        return Grid.from_lines(rows, {"1": 1})
+
+    def neighbor_masks(self) -> list[int]:
+        """The grid shifted to every neighbor: bit i of the k-th mask is set when the k-th neighbor of cell i is set."""
+        stride, bits = self.stride, self.bits
+        offsets = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        # bits shifted beyond the grid are cleared by mask (e.g. the row above the first one)
+        mask = self.mask
+        return [(bits >> offset if offset > 0 else bits << -offset) & mask for offset in offsets]
+
+    def neighbor_counts(self) -> list[int]:
+        """Number of set neighbors of every cell, bit-sliced: bit i of the k-th int is bit k of the count of cell i.
+
+        The 8 neighbor masks are added with ripple-carry adder logic on all
+        cells at once (sum bit is XOR, carry is AND).
+        """
+        counts = [0] * NEIGHBOR_COUNT_BITS
+        for carry in self.neighbor_masks():
+            for k in range(NEIGHBOR_COUNT_BITS):
+                counts[k], carry = counts[k] ^ carry, counts[k] & carry
+                if not carry:
+                    break
+        return counts
+
+    def fewer_neighbors(self, limit: int) -> int:
+        """Set cells with fewer than `limit` set neighbors (as bit mask).
+
+        Compares the bit-sliced counts with the limit from the most significant
+        bit down: a count is smaller at the first bit where the limit has a 1
+        and the count a 0, as long as all higher bits are equal.
+        """
+        smaller, equal = 0, self.mask
+        for k, count_bits in reversed(list(enumerate(self.neighbor_counts()))):
+            if limit >> k & 1:
+                smaller |= equal & ~count_bits
+                equal &= count_bits
+            else:
+                equal &= ~count_bits
+        if limit >> NEIGHBOR_COUNT_BITS:  # limit above any count
+            smaller = self.mask
+        return self.bits & smaller
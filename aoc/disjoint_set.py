@@ -0,0 +1,53 @@
+"""Advent of Code - disjoint-set (union-find)"""
+
+import heapq
+from array import array
+
+
+class DisjointSet:
+    """Disjoint-set of the elements 0..size-1 (path compression and union by size).
+
+    Parents and sizes are stored in int64 arrays, find() and union() take
+    near-constant (amortized) time.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.parent = array("q", range(size))
+        self.size = array("q", [1]) * size
+        self.count = size  # number of components
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, element: int) -> int:
+        """Representative (root) of the component of an element."""
+        parent = self.parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]  # path halving
+            element = parent[element]
+        return element
+
+    def union(self, element1: int, element2: int) -> bool:
+        """Join the components of two elements, returns False when already in the same component."""
+        root1, root2 = self.find(element1), self.find(element2)
+        if root1 == root2:
+            return False
+        if self.size[root1] < self.size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+        self.count -= 1
+        return True
+
+    def connected(self, element1: int, element2: int) -> bool:
+        return self.find(element1) == self.find(element2)
+
+    def component_size(self, element: int) -> int:
+        return self.size[self.find(element)]
+
+    def component_sizes(self) -> list[int]:
+        return [self.size[element] for element, parent in enumerate(self.parent) if element == parent]
+
+    def largest(self, k: int) -> list[int]:
+        """Sizes of the k largest components (largest first)."""
+        return heapq.nlargest(k, self.component_sizes())
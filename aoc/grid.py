@@ -0,0 +1,110 @@
+"""Advent of Code - compact 2-D grid"""
+
+from typing import Iterable, Iterator, Mapping
+
+
+class Grid:
+    """2-D grid of small integers (0..255) stored in a flat bytearray.
+
+    The grid is surrounded by a border of one cell (with value `border`), so
+    neighbors of every cell inside the grid can be found with fixed offsets in
+    the flat array without bounds checks. Cells are addressed by (row, col)
+    or by their index in the flat array (see index() and position()).
+    """
+
+    def __init__(self, height: int, width: int, fill: int = 0, border: int = 0) -> None:
+        self.height = height
+        self.width = width
+        self.stride = width + 2
+        self.border = border
+        self.cells = bytearray([border]) * (self.stride * (height + 2))
+        for row in range(height):
+            start = self.index(row, 0)
+            self.cells[start : start + width] = bytes([fill]) * width
+        stride = self.stride
+        # fmt: off
+        self.neighbor_offsets = (
+            -stride - 1, -stride, -stride + 1,
+                     -1,                   1,
+             stride - 1,  stride,  stride + 1,
+        )
+        # fmt: on
+        self.orthogonal_offsets = (-stride, -1, 1, stride)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], values: Mapping[str, int] | None = None, border: int = 0) -> "Grid":
+        """Create a grid from lines of text.
+
+        Args:
+            lines (Iterable[str]): lines of equal length.
+            values (Mapping[str, int] | None, optional): value per character, other
+                characters get value 0. Defaults to None (use the ASCII code).
+            border (int, optional): value of the border cells. Defaults to 0.
+
+        Returns:
+            Grid: the grid
+        """
+        table = bytes(range(256)) if values is None else bytes(values.get(chr(char), 0) for char in range(256))
+        rows = [line.encode("ascii").translate(table) for line in lines]
+        grid = cls(len(rows), len(rows[0]) if rows else 0, border=border)
+        for row_nr, row in enumerate(rows):
+            start = grid.index(row_nr, 0)
+            grid.cells[start : start + grid.width] = row
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        return self.cells[self.index(*position)]
+
+    def __setitem__(self, position: tuple[int, int], value: int) -> None:
+        self.cells[self.index(*position)] = value
+
+    def in_grid(self, index: int) -> bool:
+        row, col = self.position(index)
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def row(self, row: int) -> memoryview:
+        """Row as view on the cells (no copy)."""
+        start = self.index(row, 0)
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, col: int) -> memoryview:
+        """Column as (strided) view on the cells (no copy)."""
+        return memoryview(self.cells)[self.index(0, col) : self.index(self.height, col) : self.stride]
+
+    def indexes(self, value: int) -> Iterator[int]:
+        """Indexes of all cells inside the grid with a value."""
+        needle = bytes([value])
+        index = self.cells.find(needle)
+        while index != -1:
+            if value != self.border or self.in_grid(index):
+                yield index
+            index = self.cells.find(needle, index + 1)
+
+    def neighbors(self, row: int, col: int) -> list[tuple[int, int]]:
+        """Positions of the (up to 8) neighbors inside the grid."""
+        index = self.index(row, col)
+        positions = (self.position(index + offset) for offset in self.neighbor_offsets)
+        return [(r, c) for r, c in positions if 0 <= r < self.height and 0 <= c < self.width]
+
+    def neighbor_counts(self) -> bytearray:
+        """Sum of the values of the 8 neighbors of every cell (in the flat layout of cells).
+
+        All counts are calculated at once: the cells are taken as one big
+        (little endian) integer with a "digit" per cell, the sum of that
+        integer shifted by every neighbor offset is the convolution with the
+        neighbor kernel. Sums must stay below 256 (e.g. values 0 and 1), the
+        counts of border cells are meaningless.
+        """
+        size = len(self.cells)
+        cells = int.from_bytes(self.cells, "little")
+        counts = 0
+        for offset in self.neighbor_offsets:
+            counts += cells >> (8 * offset) if offset > 0 else cells << (-8 * offset)
+        return bytearray((counts & ((1 << (8 * size)) - 1)).to_bytes(size, "little"))
@@ -0,0 +1,106 @@
+"""Advent of Code - startup (import) time of solutions
+
+Loads every solution file (with importlib, nothing else imported) in a fresh
+interpreter with `-X importtime`, once without pytest (as the runner does) and
+once after importing pytest (as a test run does), and reports both totals and
+the most expensive imports:
+    python -m aoc importtime 2025 --days 1,3,6
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from aoc import PROJECT_ROOT
+from aoc.runner import SolutionModule, discover_solutions, parse_days
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    level: int  # nesting level (0: imported by the statement itself)
+
+
+def parse_importtime(importtime_output: str) -> list[ImportTime]:
+    """Parse the `-X importtime` report (lines like "import time: 123 | 456 |   module")."""
+    import_times: list[ImportTime] = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # header
+        name = module[1:]
+        level = (len(name) - len(name.lstrip())) // 2
+        import_times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us), level))
+    return import_times
+
+
+def measure_imports(statement: str) -> list[ImportTime]:
+    """Import times of running a statement in a fresh interpreter (from the project root)."""
+    python_path = os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        env=os.environ | {"PYTHONPATH": python_path},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(process.stderr)
+
+
+def total_us(import_times: list[ImportTime]) -> int:
+    return sum(import_time.cumulative_us for import_time in import_times if import_time.level == 0)
+
+
+def load_statement(solution: SolutionModule, with_pytest: bool) -> str:
+    # load the file directly (not through aoc.runner, whose own imports would be counted as well)
+    statement = (
+        "import importlib.util; "
+        f"spec = importlib.util.spec_from_file_location('solution', {str(solution.path)!r}); "
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+    )
+    return f"import pytest; {statement}" if with_pytest else statement
+
+
+def fastest_imports(statement: str, repeat: int = 3) -> list[ImportTime]:
+    """Import times of the fastest of a number of runs (the first run may suffer from a cold file cache)."""
+    return min((measure_imports(statement) for _ in range(repeat)), key=total_us)
+
+
+def report(solution: SolutionModule, top: int = 5) -> str:
+    without_pytest = fastest_imports(load_statement(solution, False))
+    with_pytest = fastest_imports(load_statement(solution, True))
+    fast, slow = total_us(without_pytest), total_us(with_pytest)
+    lines = [
+        f"Day {solution.day:2d} ({solution.path.name}):",
+        f"  imports without pytest: {fast / 1000:8.1f} ms",
+        f"  imports with pytest:    {slow / 1000:8.1f} ms (saving {(slow - fast) / 1000:.1f} ms)",
+        "  most expensive imports with pytest:",
+    ]
+    for import_time in sorted(
+        (import_time for import_time in with_pytest if import_time.level == 0),
+        key=lambda import_time: import_time.cumulative_us,
+        reverse=True,
+    )[:top]:
+        lines.append(f"    {import_time.cumulative_us / 1000:8.1f} ms  {import_time.module}")
+    return "\n".join(lines)
+
+
+def run(year: int, days: str | None = None, top: int = 5) -> int:
+    """Print the import time report of the solutions of a year.
+
+    Returns:
+        int: exit code (1 when no solutions were found)
+    """
+    solutions = discover_solutions(year, parse_days(days) if days else None)
+    if not solutions:
+        print(f"no solutions found for {year}")
+        return 1
+    for solution in solutions:
+        print(report(solution, top), flush=True)
+    return 0
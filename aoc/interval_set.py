@@ -0,0 +1,122 @@
+"""Advent of Code - set of inclusive integer ranges"""
+
+import heapq
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, Sequence
+
+
+MIN_PENDING_RANGES = 1024  # added ranges are merged in bulk once at least this many (or len(set)) are pending
+
+
+def merged_ranges(ranges: Iterable[tuple[int, int]]) -> tuple[array, array]:
+    """Starts and ends of ranges sorted by start, with overlapping and adjacent ranges merged."""
+    starts, ends = array("q"), array("q")
+    for start, end in ranges:
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class IntervalSet:
+    """Set of integers stored as sorted, non-overlapping inclusive ranges.
+
+    Ranges are kept in two parallel int64 arrays (starts and ends), so values
+    must fit in 64 bits. Overlapping and adjacent ranges are merged, e.g.
+    adding 3-5 and 6-8 results in the single range 3-8.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        self._starts, self._ends = merged_ranges(sorted(ranges))
+        self._pending: list[tuple[int, int]] = []  # added ranges, not merged yet
+
+    @property
+    def starts(self) -> array:
+        self._merge_pending()
+        return self._starts
+
+    @property
+    def ends(self) -> array:
+        self._merge_pending()
+        return self._ends
+
+    def add(self, start: int, end: int) -> None:
+        """Add the range start-end (inclusive), merging it with overlapping and adjacent ranges.
+
+        Inserting into the arrays would move their tails (O(n) per range), so
+        added ranges are buffered instead and merged in bulk (one sort of the
+        buffer and one linear merge) when the buffer holds as many ranges as
+        the set, or when the set is read. A series of adds takes O(log n)
+        amortized time per range; reading the set after every single add
+        merges every time (O(n) per add).
+        """
+        self._pending.append((start, end))
+        if len(self._pending) >= max(MIN_PENDING_RANGES, len(self._starts)):
+            self._merge_pending()
+
+    def _merge_pending(self) -> None:
+        if self._pending:
+            pending, self._pending = sorted(self._pending), []
+            self._starts, self._ends = merged_ranges(heapq.merge(zip(self._starts, self._ends), pending))
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    def contains_many(self, values: Sequence[int]) -> list[bool]:
+        """Membership of many values in a single pass over the ranges (visiting the values in sorted order)."""
+        starts, ends = self.starts, self.ends
+        contained = [False] * len(values)
+        i, number_of_ranges = 0, len(starts)
+        for position in sorted(range(len(values)), key=values.__getitem__):
+            value = values[position]
+            while i < number_of_ranges and ends[i] < value:
+                i += 1
+            if i == number_of_ranges:
+                break
+            contained[position] = starts[i] <= value
+        return contained
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __len__(self) -> int:
+        """Number of ranges."""
+        return len(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def total_length(self) -> int:
+        """Number of integers in the set."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet(heapq.merge(self, other))
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        (starts, ends), (other_starts, other_ends) = (self.starts, self.ends), (other.starts, other.ends)
+        result = IntervalSet()
+        i, j = 0, 0
+        while i < len(starts) and j < len(other_starts):
+            start = max(starts[i], other_starts[j])
+            end = min(ends[i], other_ends[j])
+            if start <= end:
+                result.starts.append(start)
+                result.ends.append(end)
+            if ends[i] < other_ends[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    __or__ = union
+    __and__ = intersection
@@ -0,0 +1,165 @@
+"""Advent of Code - k-d tree of 3-D integer points (Euclidean minimum spanning tree)"""
+
+import math
+from typing import Sequence
+
+from aoc.disjoint_set import DisjointSet
+from aoc.spatial_index import PointType
+
+LEAF_SIZE = 8  # maximum number of points in a leaf
+MIXED = -1  # label of a node with points of more than one component
+NO_PAIR = math.inf  # pair key bound when no pair was found yet
+
+type BoxType = tuple[int, int, int, int, int, int]  # bounding box: min x, max x, min y, max y, min z, max z
+
+
+def box_gap(box1: BoxType, box2: BoxType) -> int:
+    """Squared distance between two bounding boxes (0 when they overlap)."""
+    dx = max(0, box2[0] - box1[1], box1[0] - box2[1])
+    dy = max(0, box2[2] - box1[3], box1[2] - box2[3])
+    dz = max(0, box2[4] - box1[5], box1[4] - box2[5])
+    return dx * dx + dy * dy + dz * dz
+
+
+def bounding_box(points: Sequence[PointType]) -> BoxType:
+    if not points:
+        return 0, -1, 0, -1, 0, -1
+    _, xs, ys, zs = zip(*points)
+    return min(xs), max(xs), min(ys), max(ys), min(zs), max(zs)
+
+
+class KdTree:
+    """Points in 3-D space (integer coordinates) in a balanced k-d tree.
+
+    Every node splits its points in halves at the median of its widest axis,
+    down to leaves of at most LEAF_SIZE points (all leaves at the same depth).
+    Nodes are numbered like a binary heap: the root is 1 and the children of
+    node k are 2k and 2k + 1, so the leaves are first_leaf..2 * first_leaf - 1.
+    Every node has the bounding box of its points.
+
+    Pairs are packed in a single int like in SpatialIndex: squared distance
+    << 2 * index_bits | lower point number << index_bits | higher point number,
+    so they sort like (squared distance, point number, point number) tuples.
+    """
+
+    def __init__(self, xs: Sequence[int], ys: Sequence[int], zs: Sequence[int]) -> None:
+        self.axes = (xs, ys, zs)
+        self.index_bits = max(len(xs).bit_length(), 1)
+        self.first_leaf = 1 << ((max(len(xs), 1) - 1) // LEAF_SIZE).bit_length()
+        self.leaves = self.split()
+        self.boxes: list[BoxType] = [bounding_box([])] * self.first_leaf + [bounding_box(leaf) for leaf in self.leaves]
+        for node in range(self.first_leaf - 1, 0, -1):
+            left, right = self.boxes[2 * node], self.boxes[2 * node + 1]
+            self.boxes[node] = tuple(  # type: ignore[assignment]
+                min(a, b) if i % 2 == 0 else max(a, b) for i, (a, b) in enumerate(zip(left, right))
+            )
+
+    def split(self) -> list[list[PointType]]:
+        """The points of the leaves, splitting the points of every node at the median of its widest axis."""
+        xs, ys, zs = self.axes
+        order = list(range(len(xs)))
+        slices = [(0, 0), (0, len(xs))]  # points of node k: order[slices[k][0] : slices[k][1]] (there's no node 0)
+        for node in range(1, self.first_leaf):
+            low, high = slices[node]
+            spreads = []  # (spread of the points along the axis, axis number)
+            for number, axis in enumerate(self.axes):
+                values = [axis[point] for point in order[low:high]]
+                spreads.append((max(values) - min(values), number))
+            order[low:high] = sorted(order[low:high], key=self.axes[max(spreads)[1]].__getitem__)
+            middle = (low + high) // 2
+            slices += [(low, middle), (middle, high)]
+        return [
+            [(point, xs[point], ys[point], zs[point]) for point in order[low:high]]
+            for low, high in slices[self.first_leaf :]
+        ]
+
+    def __len__(self) -> int:
+        return len(self.axes[0])
+
+    def node_labels(self, labels: Sequence[int]) -> list[int]:
+        """Component of the points of every node (MIXED when they are in more than one component)."""
+        node_labels = [MIXED] * (2 * self.first_leaf)
+        for leaf, points in enumerate(self.leaves, self.first_leaf):
+            components = {labels[point] for point, _, _, _ in points}
+            if len(components) == 1:
+                node_labels[leaf] = components.pop()
+        for node in range(self.first_leaf - 1, 0, -1):
+            left, right = node_labels[2 * node], node_labels[2 * node + 1]
+            node_labels[node] = left if left == right else MIXED
+        return node_labels
+
+    def leaf_pairs(
+        self, points: list[PointType], others: list[PointType], labels: Sequence[int], closest: dict[int, int]
+    ) -> None:
+        """Update the closest pair (key) per component with the pairs of points with others in another component."""
+        index_bits = self.index_bits
+        shift = 2 * index_bits
+        for point, x1, y1, z1 in points:
+            label = labels[point]
+            keys = [
+                ((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2) << shift
+                | (point << index_bits | other if point < other else other << index_bits | point)
+                for other, x2, y2, z2 in others
+                if labels[other] != label
+            ]
+            if keys and (key := min(keys)) < closest.get(label, NO_PAIR):
+                closest[label] = key
+
+    def search(self, leaf: int, labels: Sequence[int], node_labels: list[int], closest: dict[int, int]) -> None:
+        """Update the closest pair (key) per component with the pairs of the points of a leaf.
+
+        Depth first, nearest child first: nodes with only points of the
+        component of the leaf and nodes further away than the closest pair
+        found so far (of every component in the leaf) are skipped.
+        """
+        points, leaf_box, leaf_label = self.leaves[leaf - self.first_leaf], self.boxes[leaf], node_labels[leaf]
+        components, shift = {labels[point] for point, _, _, _ in points}, 2 * self.index_bits
+        bound = max(closest.get(component, NO_PAIR) for component in components)
+        stack = [(0, 1)]  # (squared distance to the leaf, node)
+        while stack:
+            gap, node = stack.pop()
+            if gap << shift > bound:
+                continue
+            if node >= self.first_leaf:
+                self.leaf_pairs(points, self.leaves[node - self.first_leaf], labels, closest)
+                bound = max(closest.get(component, NO_PAIR) for component in components)
+                continue
+            children = [
+                (box_gap(leaf_box, self.boxes[child]), child)
+                for child in (2 * node, 2 * node + 1)
+                if leaf_label == MIXED or node_labels[child] != leaf_label
+            ]
+            stack.extend(sorted(children, reverse=True))  # the nearest child is taken first
+
+    def closest_pairs(self, labels: Sequence[int]) -> dict[int, int]:
+        """Closest pair (key) per component with a point in another component (components are labels of points)."""
+        node_labels = self.node_labels(labels)
+        closest: dict[int, int] = {}
+        for leaf in range(self.first_leaf, 2 * self.first_leaf):
+            self.search(leaf, labels, node_labels, closest)
+        return closest
+
+    def minimum_spanning_tree(self, components: DisjointSet | None = None) -> list[tuple[int, int, int]]:
+        """Edges (squared distance, point number, higher point number) of the Euclidean minimum spanning tree, sorted.
+
+        Borůvka: every round connects every component with its closest other
+        component, so the number of components (at least) halves every round.
+        Pairs are ordered by (squared distance, point numbers), so all pairs
+        differ and the tree is the one Kruskal's algorithm builds when taking
+        the pairs in that order (e.g. the last pair it takes is the last edge).
+
+        Given components (connected by edges of the tree, e.g. by taking the
+        shortest pairs first), only the edges connecting those are returned,
+        and the components are connected (updated in place).
+        """
+        index_bits = self.index_bits
+        if components is None:
+            components = DisjointSet(len(self))
+        index_mask = (1 << index_bits) - 1
+        edges: list[tuple[int, int, int]] = []
+        while components.count > 1:
+            for key in self.closest_pairs([components.find(point) for point in range(len(self))]).values():
+                point, other = key >> index_bits & index_mask, key & index_mask
+                if components.union(point, other):
+                    edges.append((key >> 2 * index_bits, point, other))
+        return sorted(edges)
@@ -0,0 +1,105 @@
+"""Advent of Code - profile (puzzle) functions without changing their code
+
+Set the environment variable AOC_PROFILE to one of the PROFILERS and every
+function wrapped by profiled() (or decorated with measure_duration()) is run
+under that profiler. `python -m aoc run --profile ...` wraps every part; the
+main() of a solution doesn't, so to profile a solution run directly, decorate
+the part (or parse) with measure_duration() first. A profile is written per
+function to AOC_PROFILE_DIR (default: 'profiles' below the project root),
+named after the module and function, e.g.:
+- cprofile: aoc2025_day08_playground.part_2.prof (view with snakeviz)
+- pyinstrument: aoc2025_day08_playground.part_2.html
+- line_profiler: aoc2025_day08_playground.part_2.lprof and .txt
+"""
+
+import cProfile
+import importlib
+import os
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+PROFILE_ENV_VAR = "AOC_PROFILE"
+PROFILE_DIR_ENV_VAR = "AOC_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = Path(__file__).resolve().parent.parent / "profiles"
+PROFILERS = ("cprofile", "pyinstrument", "line_profiler")
+
+
+class UnknownProfilerException(Exception):
+    """Unknown profiler"""
+
+
+def profile_basename(func: Callable[..., Any]) -> Path:
+    """Profile file name (without extension) for a function."""
+    profile_dir = Path(os.environ.get(PROFILE_DIR_ENV_VAR, DEFAULT_PROFILE_DIR))
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    return profile_dir / f"{Path(func.__code__.co_filename).stem}.{func.__name__}"
+
+
+def _run_cprofile(func: Callable[..., R], basename: Path, *args: Any, **kwargs: Any) -> R:
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    profiler.dump_stats(basename.with_name(f"{basename.name}.prof"))
+    return result
+
+
+def _run_pyinstrument(func: Callable[..., R], basename: Path, *args: Any, **kwargs: Any) -> R:
+    pyinstrument = importlib.import_module("pyinstrument")  # optional (dev) dependency
+    profiler = pyinstrument.Profiler()
+    profiler.start()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.stop()
+    basename.with_name(f"{basename.name}.html").write_text(profiler.output_html(), encoding="utf-8")
+    return result
+
+
+def _run_line_profiler(func: Callable[..., R], basename: Path, *args: Any, **kwargs: Any) -> R:
+    line_profiler = importlib.import_module("line_profiler")  # optional (dev) dependency
+    profiler = line_profiler.LineProfiler(func)
+    result = profiler.runcall(func, *args, **kwargs)
+    profiler.dump_stats(str(basename.with_name(f"{basename.name}.lprof")))
+    with open(basename.with_name(f"{basename.name}.txt"), "w", encoding="utf-8") as fh_out:
+        profiler.print_stats(stream=fh_out)
+    return result
+
+
+RUNNERS: dict[str, Callable[..., Any]] = {
+    "cprofile": _run_cprofile,
+    "pyinstrument": _run_pyinstrument,
+    "line_profiler": _run_line_profiler,
+}
+
+
+def profiled(func: Callable[P, R], profiler: str | None = None) -> Callable[P, R]:
+    """Wrap a function to run it under a profiler when requested.
+
+    Args:
+        func (Callable[P, R]): function to profile.
+        profiler (str | None, optional): one of PROFILERS. Defaults to None
+            (use the AOC_PROFILE environment variable at call time, no
+            profiling when not set).
+
+    Raises:
+        UnknownProfilerException: when the profiler is not one of PROFILERS
+
+    Returns:
+        Callable[P, R]: wrapped function
+    """
+
+    @wraps(func)
+    def wrap_func(*args: P.args, **kwargs: P.kwargs) -> R:
+        selected_profiler = profiler or os.environ.get(PROFILE_ENV_VAR)
+        if not selected_profiler:
+            return func(*args, **kwargs)
+        if selected_profiler not in RUNNERS:
+            raise UnknownProfilerException(
+                f"unknown profiler '{selected_profiler}' (use one of {', '.join(PROFILERS)})"
+            )
+        return RUNNERS[selected_profiler](func, profile_basename(func), *args, **kwargs)
+
+    return wrap_func
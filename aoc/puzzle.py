@@ -0,0 +1,38 @@
+"""Advent of Code - protocol of the solution modules
+
+The puzzle input is read and parsed once, both parts get the parsed input:
+    parsed = parse(puzzle_input())
+    part_1(parsed), part_2(parsed)
+The parts must not modify the parsed input (it is shared). Reading, parsing
+and solving each part are timed separately by the runner.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+T = TypeVar("T")
+
+PARTS = ("part_1", "part_2")
+
+
+@dataclass(frozen=True)
+class Timings:
+    """Durations (seconds) of reading and parsing the puzzle input (shared by the parts) and of solving a part."""
+
+    input_duration: float = 0.0
+    parse_duration: float = 0.0
+    solve_duration: float = 0.0
+
+
+class Puzzle(Protocol[T]):
+    """Solution module of a puzzle (a module, so the methods are module level functions)."""
+
+    def puzzle_input(self) -> Any:
+        """Read the puzzle input (e.g. as lines)."""
+
+    def parse(self, puzzle_input: Any, /) -> T:
+        """Parse the puzzle input into the structure both parts work on."""
+
+    def part_1(self, parsed: T, /) -> int | str: ...
+
+    def part_2(self, parsed: T, /) -> int | str: ...
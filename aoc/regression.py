@@ -0,0 +1,190 @@
+"""Advent of Code - performance regression checks against a stored benchmark history
+
+Parsing and every part of the selected solutions are benchmarked on the
+real puzzle input (the input is read once, outside the measurement) and
+compared with the baseline: the latest run in the history for the same
+Python version. A step is flagged when its median is more than `threshold`
+slower than the baseline median (and slower by more than NOISE_FLOOR
+seconds, which keeps very fast steps from flapping). The run is appended to the history, a JSON file with:
+{"version": 1, "runs": [{"commit", "dirty", "python", "timestamp", "results"}]}
+where results maps "<year>/<day>/<parse|part_1|part_2>" to the benchmark summary.
+
+Everything is local (git is only asked for the current commit), so it can
+run offline, e.g. before pushing:
+    python -m aoc bench 2025 --threshold 0.2
+"""
+
+import json
+import platform
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from aoc import PROJECT_ROOT
+from aoc.benchmark import Benchmark
+from aoc.puzzle import PARTS
+from aoc.runner import SolutionModule, discover_solutions, load_solution_module, parse_days, result_key
+
+HISTORY_VERSION = 1
+DEFAULT_HISTORY_FILE = PROJECT_ROOT / "benchmarks" / "history.json"
+DEFAULT_THRESHOLD = 0.2
+NOISE_FLOOR = 0.0005
+
+type HistoryType = dict[str, Any]
+type RunResultsType = dict[str, dict[str, Any]]
+
+
+class HistoryVersionException(Exception):
+    """Benchmark history written by an unsupported version"""
+
+
+@dataclass(frozen=True)
+class BenchOptions:
+    """Options of a benchmark run (see run())."""
+
+    repeat: int = 5  # measured runs per step
+    threshold: float = DEFAULT_THRESHOLD  # allowed slowdown relative to the baseline
+    history_file: Path = DEFAULT_HISTORY_FILE
+    save: bool = True  # add the run to the history
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.current / self.baseline - 1
+
+    def __str__(self) -> str:
+        return f"{self.key}: median {self.current:.6f}s, baseline {self.baseline:.6f}s (+{self.slowdown:.0%})"
+
+
+def git_commit() -> tuple[str, bool]:
+    """Current git commit and whether the working tree has changes ("unknown" outside a git checkout)."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit, bool(status.strip())
+
+
+def python_version() -> str:
+    return f"{platform.python_implementation()} {platform.python_version()}"
+
+
+def load_history(path: Path) -> HistoryType:
+    """Load the benchmark history (an empty history when the file doesn't exist).
+
+    Raises:
+        HistoryVersionException: when the history has an unsupported version
+    """
+    if not path.exists():
+        return {"version": HISTORY_VERSION, "runs": []}
+    history = json.loads(path.read_text(encoding="utf-8"))
+    if history.get("version") != HISTORY_VERSION:
+        raise HistoryVersionException(f"{path}: unsupported history version {history.get('version')}")
+    return history
+
+
+def save_history(path: Path, history: HistoryType) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2) + "\n", encoding="utf-8")
+
+
+def baseline_results(history: HistoryType, python: str) -> RunResultsType:
+    """Latest result per part measured with the same Python version."""
+    baseline: RunResultsType = {}
+    for history_run in history["runs"]:
+        if history_run["python"] == python:
+            baseline.update(history_run["results"])
+    return baseline
+
+
+def find_regressions(
+    results: RunResultsType, baseline: RunResultsType, threshold: float = DEFAULT_THRESHOLD
+) -> list[Regression]:
+    """Parts which are more than threshold (relative) and NOISE_FLOOR (absolute) slower than the baseline."""
+    regressions: list[Regression] = []
+    for key, summary in results.items():
+        if key not in baseline:
+            continue
+        current, previous = summary["median"], baseline[key]["median"]
+        if current > previous * (1 + threshold) and current - previous > NOISE_FLOOR:
+            regressions.append(Regression(key, previous, current))
+    return regressions
+
+
+def benchmark_solutions(solutions: list[SolutionModule], benchmark: Benchmark) -> RunResultsType:
+    """Benchmark parsing and all parts of the solutions (sequentially, in this process)."""
+    results: RunResultsType = {}
+    for solution in solutions:
+        module = load_solution_module(solution.path)
+        puzzle_input = module.puzzle_input()
+        if isinstance(puzzle_input, Iterator):  # streamed input can be consumed only once
+            puzzle_input = list(puzzle_input)
+        parse_result = benchmark.run(module.parse, puzzle_input)
+        benchmark_results = {"parse": parse_result}
+        for part in PARTS:
+            benchmark_results[part] = benchmark.run(getattr(module, part), parse_result.result)
+        for step, benchmark_result in benchmark_results.items():
+            key = result_key(solution, step)
+            summary = benchmark_result.as_dict(percentiles=())
+            del summary["name"]
+            results[key] = summary
+            print(f"{key}: median {summary['median']:.6f}s")
+    return results
+
+
+def run(year: int, days: str | None = None, options: BenchOptions | None = None) -> int:
+    """Benchmark the solutions of a year, report regressions and add the run to the history.
+
+    Returns:
+        int: exit code (1 when a part is slower than its baseline)
+    """
+    options = options or BenchOptions()
+    solutions = discover_solutions(year, parse_days(days) if days else None)
+    if not solutions:
+        print(f"no solutions found for {year}")
+        return 1
+    history = load_history(options.history_file)
+    python = python_version()
+    baseline = baseline_results(history, python)
+    results = benchmark_solutions(solutions, Benchmark(warmup=1, repeat=options.repeat))
+
+    regressions = find_regressions(results, baseline, options.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} part(s) slower than the baseline by more than {options.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+    elif baseline:
+        print(f"\nno regressions (threshold {options.threshold:.0%})")
+    else:
+        print(f"\nno baseline for {python} yet")
+
+    if options.save:
+        commit, dirty = git_commit()
+        history["runs"].append(
+            {
+                "commit": commit,
+                "dirty": dirty,
+                "python": python,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "results": results,
+            }
+        )
+        save_history(options.history_file, history)
+    return 1 if regressions else 0
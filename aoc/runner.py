@@ -0,0 +1,243 @@
+"""Advent of Code - run the solutions of many days in a process pool
+
+A solution module is a file `<year>/aoc<year>_day<NN>_<title>.py` below the
+project root which implements the aoc.puzzle.Puzzle protocol: `puzzle_input()`
+reads the puzzle input, `parse()` parses it once and `part_1()` / `part_2()`
+take the parsed input.
+Optionally it provides `generate_puzzle_input(size, seed)` returning synthetic
+puzzle input (text) for scaling benchmarks (see aoc.scaling).
+"""
+
+import importlib.util
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable
+
+from aoc import PROJECT_ROOT
+from aoc.answer_cache import AnswerCache
+from aoc.profiling import PROFILE_ENV_VAR, profiled
+from aoc.puzzle import PARTS, Puzzle, Timings
+
+SOLUTION_FILENAME_RE = re.compile(r"aoc(?P<year>\d{4})_day(?P<day>\d{2})_\w+\.py")
+
+
+@dataclass
+class SolutionModule:
+    year: int
+    day: int
+    path: Path
+
+
+@dataclass
+class PartResult:
+    year: int
+    day: int
+    part: str
+    answer: int | str | None = None
+    timings: Timings = field(default_factory=Timings)  # reading and parsing are shared by the parts of a solution
+    error: str | None = None
+    cached: bool = False
+
+
+def parse_days(days: str) -> set[int]:
+    """Parse a selection of days like "1-3,5,7-8".
+
+    Args:
+        days (str): comma separated days and (inclusive) ranges of days.
+
+    Raises:
+        ValueError: when the selection cannot be parsed
+
+    Returns:
+        set[int]: selected days
+    """
+    selected: set[int] = set()
+    for days_part in days.split(","):
+        first, _, last = days_part.strip().partition("-")
+        selected.update(range(int(first), int(last or first) + 1))
+    return selected
+
+
+def result_key(solution: SolutionModule, part: str) -> str:
+    return f"{solution.year}/{solution.day:02d}/{part}"
+
+
+def discover_solutions(year: int, days: Iterable[int] | None = None) -> list[SolutionModule]:
+    """Find the solution modules of a year (ordered by day).
+
+    Args:
+        year (int): year of the puzzles.
+        days (Iterable[int] | None, optional): days to select. Defaults to None (all days).
+
+    Returns:
+        list[SolutionModule]: solution modules found
+    """
+    selected_days = set(days) if days is not None else None
+    solutions: list[SolutionModule] = []
+    for path in sorted((PROJECT_ROOT / str(year)).glob(f"aoc{year}_day*.py")):
+        match = SOLUTION_FILENAME_RE.fullmatch(path.name)
+        if match is None:
+            continue
+        day = int(match["day"])
+        if selected_days is None or day in selected_days:
+            solutions.append(SolutionModule(year, day, path))
+    return solutions
+
+
+def load_solution_module(path: Path) -> ModuleType:
+    """Import a solution module from its file (once per process)."""
+    if path.stem in sys.modules:
+        return sys.modules[path.stem]
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot import {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module  # dataclasses need to find the module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_solution(solution: SolutionModule, parts: Iterable[str] = PARTS) -> list[PartResult]:
+    """Read and parse the puzzle input once and solve the parts (runs in a worker process)."""
+    part_results = [PartResult(solution.year, solution.day, part) for part in parts]
+    try:
+        module: Puzzle = load_solution_module(solution.path)
+        t1 = time.perf_counter()
+        puzzle_input = module.puzzle_input()
+        t2 = time.perf_counter()
+        parsed = profiled(module.parse)(puzzle_input)
+        t3 = time.perf_counter()
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        for part_result in part_results:
+            part_result.error = f"{type(exc).__name__}: {exc}"
+        return part_results
+    for part_result in part_results:
+        part_result.timings = Timings(t2 - t1, t3 - t2)
+        try:
+            t4 = time.perf_counter()
+            part_result.answer = profiled(getattr(module, part_result.part))(parsed)
+            part_result.timings = replace(part_result.timings, solve_duration=time.perf_counter() - t4)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            part_result.error = f"{type(exc).__name__}: {exc}"
+    return part_results
+
+
+def cached_part(cache: AnswerCache, solution: SolutionModule, part: str) -> PartResult | None:
+    """Result of a part from the answer cache (None when not cached or stale)."""
+    entry = cache.lookup(result_key(solution, part), solution.path)
+    if entry is None:
+        return None
+    timings = Timings(entry["input_duration"], entry["parse_duration"], entry["solve_duration"])
+    return PartResult(solution.year, solution.day, part, entry["answer"], timings, cached=True)
+
+
+def run_solutions(
+    solutions: Iterable[SolutionModule], jobs: int | None = None, cache: AnswerCache | None = None
+) -> list[PartResult]:
+    """Run the solutions in a process pool (a task per solution, the parts share the parsed input).
+
+    Args:
+        solutions (Iterable[SolutionModule]): solutions to run.
+        jobs (int | None, optional): number of worker processes. Defaults to None (number of CPUs).
+        cache (AnswerCache | None, optional): answer cache, only parts which are not in the cache are run
+            (and their answers are added to it). Defaults to None (run all parts).
+
+    Returns:
+        list[PartResult]: results (in the order of the solutions and parts)
+    """
+    results: dict[tuple[int, int, str], PartResult] = {}
+    tasks: list[tuple[SolutionModule, list[str]]] = []
+    for solution in solutions:
+        pending_parts: list[str] = []
+        for part in PARTS:
+            part_result = cached_part(cache, solution, part) if cache is not None else None
+            if part_result is None:
+                pending_parts.append(part)
+            else:
+                results[solution.year, solution.day, part] = part_result
+        if pending_parts:
+            tasks.append((solution, pending_parts))
+    if tasks:  # no process pool at all when everything is cached
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(tasks))) as executor:
+            futures = [(solution, executor.submit(run_solution, solution, parts)) for solution, parts in tasks]
+            for solution, future in futures:
+                for part_result in future.result():
+                    results[solution.year, solution.day, part_result.part] = part_result
+                    if cache is not None and part_result.error is None and isinstance(part_result.answer, (int, str)):
+                        key = result_key(solution, part_result.part)
+                        cache.store(key, solution.path, part_result.answer, part_result.timings)
+    return [results[key] for key in sorted(results)]
+
+
+def total_durations(results: list[PartResult]) -> tuple[float, float, float]:
+    """Total durations of reading, parsing (both once per solution) and solving."""
+    solution_timings = {(result.year, result.day): result.timings for result in results}
+    return (
+        sum(timings.input_duration for timings in solution_timings.values()),
+        sum(timings.parse_duration for timings in solution_timings.values()),
+        sum(result.timings.solve_duration for result in results),
+    )
+
+
+def format_results(results: list[PartResult]) -> str:
+    """Format results as a table."""
+    header = ("Day", "Part", "Answer", "Input (s)", "Parse (s)", "Solve (s)", "Cached")
+    rows = [
+        (
+            f"{result.day:2d}",
+            result.part[-1],
+            str(result.answer) if result.error is None else f"error ({result.error})",
+            f"{result.timings.input_duration:.4f}",
+            f"{result.timings.parse_duration:.4f}",
+            f"{result.timings.solve_duration:.4f}",
+            "yes" if result.cached else "",
+        )
+        for result in results
+    ]
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [" | ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in [header, *rows]]
+    lines.insert(1, "-+-".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def run(
+    year: int, days: str | None = None, jobs: int | None = None, profiler: str | None = None, use_cache: bool = True
+) -> int:
+    """Run the solutions of a year and print a table with answers and timings.
+
+    Answers (and the timings of the run that calculated them) are taken from
+    the answer cache when neither the solution nor its puzzle input changed,
+    unless use_cache is False. When a profiler is given, every part is
+    profiled (see aoc.profiling) and the cache isn't used.
+
+    Returns:
+        int: exit code (1 when a part failed)
+    """
+    if profiler is not None:
+        os.environ[PROFILE_ENV_VAR] = profiler  # inherited by the worker processes
+    solutions = discover_solutions(year, parse_days(days) if days else None)
+    if not solutions:
+        print(f"no solutions found for {year}")
+        return 1
+    cache = AnswerCache.load() if use_cache and profiler is None else None
+    t1 = time.perf_counter()
+    results = run_solutions(solutions, jobs, cache)
+    t2 = time.perf_counter()
+    if cache is not None:
+        cache.prune()
+        cache.save()
+    print(format_results(results))
+    input_duration, parse_duration, solve_duration = total_durations(results)
+    print(
+        f"\nTotal: {input_duration:.4f}s reading input, {parse_duration:.4f}s parsing, {solve_duration:.4f}s solving, "
+        f"{(t2 - t1):.4f}s wall time"
+    )
+    if any(result.cached for result in results):
+        print("Cached answers show the timings of the run that calculated them (use --no-cache to recalculate).")
+    return 1 if any(result.error is not None for result in results) else 0
@@ -0,0 +1,121 @@
+"""Advent of Code - scaling benchmarks on synthetic puzzle input
+
+Solution modules can provide `generate_puzzle_input(size, seed)`, returning
+deterministic synthetic puzzle input where `size` scales the input (e.g. the
+number of lines or the width of a grid, see the generator of the day).
+Parsing and every part are run on inputs of increasing sizes, for each size
+the median duration and peak memory (traced allocations) are reported. The
+growth exponent k of duration ~ size^k is fitted with least squares on the
+log-log values, e.g. a k close to 2 means the step is quadratic in the size:
+    python -m aoc scale 2025 --days 4,8 --sizes 100,200,400,800
+"""
+
+import math
+import statistics
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from aoc import clear_puzzle_input_cache, use_data_dir
+from aoc.benchmark import Benchmark
+from aoc.puzzle import PARTS
+from aoc.runner import SolutionModule, discover_solutions, load_solution_module, parse_days
+
+DEFAULT_SIZES = (100, 200, 400, 800, 1600)
+
+
+@dataclass
+class ScalingResult:
+    day: int
+    step: str  # parse or part
+    sizes: list[int]
+    durations: list[float]  # median durations (seconds)
+    peak_memory: list[int]  # bytes
+
+    @property
+    def growth_exponent(self) -> float:
+        """Fitted k of duration ~ size^k (NaN when it cannot be fitted)."""
+        points = [
+            (math.log(size), math.log(duration)) for size, duration in zip(self.sizes, self.durations) if duration > 0
+        ]
+        if len(points) < 2 or len({x for x, _ in points}) < 2:
+            return math.nan
+        slope, _ = statistics.linear_regression(*zip(*points))
+        return slope
+
+
+def peak_memory(func: Any, *args: Any) -> int:
+    """Peak of the memory allocated (traced by tracemalloc) while running func(*args)."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def synthetic_puzzle_input(module: Any, solution: SolutionModule, size: int, seed: int, data_dir: Path) -> Any:
+    """Write synthetic puzzle input to data_dir and load it like the real puzzle input."""
+    puzzle_input_file = data_dir / str(solution.year) / solution.path.with_suffix(".txt").name
+    puzzle_input_file.parent.mkdir(parents=True, exist_ok=True)
+    puzzle_input_file.write_text(module.generate_puzzle_input(size, seed), encoding="utf-8")
+    with use_data_dir(data_dir):
+        puzzle_input = module.puzzle_input()
+        if isinstance(puzzle_input, Iterator):  # streamed input can be consumed only once
+            puzzle_input = list(puzzle_input)
+    return puzzle_input
+
+
+def scale_solution(
+    solution: SolutionModule, sizes: Iterable[int], seed: int = 0, benchmark: Benchmark | None = None
+) -> list[ScalingResult]:
+    """Parse and run both parts of a solution on synthetic input of increasing sizes."""
+    benchmark = benchmark or Benchmark(warmup=0, repeat=3)
+    module = load_solution_module(solution.path)
+    results = [ScalingResult(solution.day, step, [], [], []) for step in ("parse", *PARTS)]
+    with tempfile.TemporaryDirectory(prefix="aoc_scaling_") as tmp_dir:
+        for size in sizes:
+            puzzle_input = synthetic_puzzle_input(module, solution, size, seed, Path(tmp_dir))
+            parsed = module.parse(puzzle_input)
+            for result in results:
+                step_input = puzzle_input if result.step == "parse" else parsed
+                step = getattr(module, result.step)
+                result.sizes.append(size)
+                result.durations.append(benchmark.run(step, step_input).median)
+                result.peak_memory.append(peak_memory(step, step_input))
+    clear_puzzle_input_cache()  # drop the (deleted) synthetic input
+    return results
+
+
+def format_results(results: list[ScalingResult]) -> str:
+    lines: list[str] = []
+    for result in results:
+        lines.append(f"Day {result.day:2d} {result.step}: growth exponent {result.growth_exponent:.2f}")
+        for size, duration, peak in zip(result.sizes, result.durations, result.peak_memory):
+            lines.append(f"  size {size:>9d}: {duration:10.6f}s, peak memory {peak / 1024 / 1024:9.2f} MiB")
+    return "\n".join(lines)
+
+
+def run(
+    year: int, days: str | None = None, sizes: Iterable[int] = DEFAULT_SIZES, seed: int = 0, repeat: int = 3
+) -> int:
+    """Run the scaling benchmarks of a year and print durations, peak memory and growth exponents.
+
+    Returns:
+        int: exit code (1 when no solution provides a generator)
+    """
+    sizes = sorted(sizes)
+    solutions = [
+        solution
+        for solution in discover_solutions(year, parse_days(days) if days else None)
+        if hasattr(load_solution_module(solution.path), "generate_puzzle_input")
+    ]
+    if not solutions:
+        print(f"no solutions with a puzzle input generator found for {year}")
+        return 1
+    for solution in solutions:
+        print(format_results(scale_solution(solution, sizes, seed, Benchmark(warmup=0, repeat=repeat))), flush=True)
+    return 0
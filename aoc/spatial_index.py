@@ -0,0 +1,231 @@
+"""Advent of Code - spatial index of 3-D integer points (uniform grid buckets)"""
+
+import functools
+import heapq
+import math
+from collections import Counter
+from typing import Iterator, Sequence
+
+POINTS_PER_CELL = 1  # average number of points per cell (of evenly spread points) the cell size is chosen for
+MAX_CELLS_PER_POINT = 4  # cells are made larger when there would be more (e.g. all points on a line)
+MAX_CELL_CROWDING = 8  # cells are made smaller while points share their cell with more points (e.g. clusters)
+SORT_PAIRS_PER_POINT = 32  # after this many pairs (per point) the remaining pairs are sorted all at once
+
+type PointType = tuple[int, int, int, int]  # point number, x, y, z
+
+
+@functools.lru_cache(maxsize=32)
+def ring_offsets(radius: int, cells_per_axis: tuple[int, int, int]) -> tuple[int, ...]:
+    """Cell number offsets of the cells at Chebyshev distance `radius` from a cell (the surface of a cube).
+
+    Offsets at least the size of the grid (along an axis) can't reach a cell
+    of the grid and are left out (e.g. a flat grid has a flat ring).
+    """
+    _, ny, nz = cells_per_axis
+    sides = [range(-min(radius, count - 1), min(radius, count - 1) + 1) for count in cells_per_axis]
+    ends = [dz for dz in (-radius, radius) if abs(dz) < nz]
+    # on the sides of the cube the whole row along the z-axis, otherwise only the bottom and the top cell
+    return tuple(
+        (dx * 2 * ny + dy) * 2 * nz + dz
+        for dx in sides[0]
+        for dy in sides[1]
+        for dz in (sides[2] if abs(dx) == radius or abs(dy) == radius else ends)
+    )
+
+
+class NeighborStream:  # pylint: disable=too-few-public-methods
+    """The pairs of a single point (see SpatialIndex.pairs_by_distance), closest first.
+
+    The cells around the point are scanned ring by ring. After scanning the
+    rings up to radius r, all points within distance r * cell_size have been
+    seen (points in further rings are more than that away), so candidates up
+    to that distance are final. When a ring has more columns of cells than
+    there are points (e.g. far outliers), all remaining points are scanned at
+    once instead.
+    """
+
+    __slots__ = ("index", "point", "cell", "radius", "candidates")
+
+    def __init__(self, index: "SpatialIndex", point: int) -> None:
+        self.index, self.point = index, point
+        self.cell = index.cell_number(index.cell_of(point))
+        self.radius = -1
+        self.candidates: list[int] = []  # heap of squared distance << index_bits | other point
+
+    def pop(self) -> int | None:
+        """Closest pair not generated yet (squared distance << index_bits | other point), None when exhausted."""
+        index, heap = self.index, self.candidates
+        max_radius, index_bits = index.max_radius, index.index_bits
+        while True:
+            if heap and (self.radius >= max_radius or heap[0] >> index_bits <= (self.radius * index.cell_size) ** 2):
+                return heapq.heappop(heap)
+            if self.radius >= max_radius:
+                return None
+            self.radius += 1
+            if (2 * self.radius + 1) ** 2 > len(index):
+                heap.extend(index.pair_candidates(self.point, index.cells_beyond(self.cell, self.radius)))
+                self.radius = max_radius
+            else:
+                heap.extend(index.pair_candidates(self.point, index.ring(self.cell, self.radius)))
+            heapq.heapify(heap)
+
+
+class SpatialIndex:
+    """Points in 3-D space (integer coordinates) bucketed in a uniform grid of cubic cells.
+
+    Pairs of points can be generated in order of (squared) distance on demand,
+    without generating all n^2 / 2 pairs: every point has a lazy stream of its
+    neighbors in order of distance (NeighborStream) and the streams are merged
+    with a heap. For evenly spread points generating the k closest pairs takes
+    about O((n + k) log n) time and O(n + k) memory.
+
+    The cell size follows from the volume of the bounding box, but cells are
+    made smaller while points are crowded in a few cells (clustered points).
+    Only cells with points are stored, by cell number (x * 2ny + y) * 2nz + z:
+    with twice the number of cells per axis as strides, cell numbers of cells
+    outside the grid (less than the size of the grid away) are never those of
+    cells in the grid, so a ring around any cell has the same offsets.
+    """
+
+    def __init__(self, xs: Sequence[int], ys: Sequence[int], zs: Sequence[int]) -> None:
+        self.axes = (xs, ys, zs)
+        self.index_bits = max(len(xs).bit_length(), 1)  # number of bits of a point number (in packed pairs)
+        self.minimum = (min(xs, default=0), min(ys, default=0), min(zs, default=0))
+        self.cell_size = self.fitting_cell_size()
+        extent = [max(axis, default=0) - low + 1 for axis, low in zip(self.axes, self.minimum)]
+        self.cells_per_axis = tuple(-(-length // self.cell_size) for length in extent)
+        self.cells: dict[int, list[PointType]] = {}  # points of the cells with points (by cell number)
+        for point, coordinates in enumerate(zip(xs, ys, zs)):
+            self.cells.setdefault(self.cell_number(self.cell_of(point)), []).append((point, *coordinates))
+
+    def __len__(self) -> int:
+        return len(self.axes[0])
+
+    @property
+    def max_radius(self) -> int:
+        """Ring radius (around any cell) which covers the whole grid."""
+        return max(self.cells_per_axis)
+
+    def crowding(self, cell_size: int) -> float:
+        """Average number of points in the cell of a point (itself included) for a cell size."""
+        (min_x, min_y, min_z), (xs, ys, zs) = self.minimum, self.axes
+        counts = Counter(
+            zip(
+                [(x - min_x) // cell_size for x in xs],
+                [(y - min_y) // cell_size for y in ys],
+                [(z - min_z) // cell_size for z in zs],
+            )
+        )
+        return sum(count * count for count in counts.values()) / max(len(self), 1)
+
+    def fitting_cell_size(self) -> int:
+        size = len(self)
+        extent = [max(axis, default=0) - low + 1 for axis, low in zip(self.axes, self.minimum)]
+        cell_size = max(1, math.ceil((math.prod(extent) * POINTS_PER_CELL / max(size, 1)) ** (1 / 3)))
+        while math.prod(-(-length // cell_size) for length in extent) > MAX_CELLS_PER_POINT * size + 1:
+            cell_size *= 2
+        while cell_size > 1 and self.crowding(cell_size) > MAX_CELL_CROWDING:
+            cell_size //= 2
+        return cell_size
+
+    def cell_of(self, point: int) -> tuple[int, int, int]:
+        (min_x, min_y, min_z), (xs, ys, zs), cell_size = self.minimum, self.axes, self.cell_size
+        return (xs[point] - min_x) // cell_size, (ys[point] - min_y) // cell_size, (zs[point] - min_z) // cell_size
+
+    def cell_number(self, cell: tuple[int, int, int]) -> int:
+        _, ny, nz = self.cells_per_axis
+        return (cell[0] * 2 * ny + cell[1]) * 2 * nz + cell[2]
+
+    def ring(self, cell: int, radius: int) -> list[list[PointType]]:
+        """Points (per cell) in the cells at Chebyshev distance `radius` from a cell (number)."""
+        get = self.cells.get
+        return [points for offset in ring_offsets(radius, self.cells_per_axis) if (points := get(cell + offset))]
+
+    def cell_coordinates(self, cell: int) -> tuple[int, int, int]:
+        _, ny, nz = self.cells_per_axis
+        x, yz = divmod(cell, 4 * ny * nz)
+        return (x, *divmod(yz, 2 * nz))
+
+    def cells_beyond(self, cell: int, radius: int) -> list[list[PointType]]:
+        """Points (per cell) in the cells at Chebyshev distance `radius` or more from a cell (number)."""
+        center = self.cell_coordinates(cell)
+        return [
+            points
+            for number, points in self.cells.items()
+            if max(abs(a - b) for a, b in zip(self.cell_coordinates(number), center)) >= radius
+        ]
+
+    def pair_candidates(self, point: int, cells: list[list[PointType]]) -> list[int]:
+        """Pairs (in the stream of a point) with the points in cells as squared distance << index_bits | other point."""
+        (xs, ys, zs), index_bits = self.axes, self.index_bits
+        x1, y1, z1 = xs[point], ys[point], zs[point]
+        return [
+            ((x - x1) ** 2 + (y - y1) ** 2 + (z - z1) ** 2) << index_bits | other
+            for points in cells
+            for other, x, y, z in points
+            if (other > point) != bool((point ^ other) & 1)
+        ]
+
+    def pair_key(self, point: int, neighbor: int) -> int:
+        """Pair packed in a single int: squared distance << 2 * index_bits | lower number << index_bits | higher number.
+
+        These sort like (squared distance, point number, point number) tuples.
+        """
+        index_bits = self.index_bits
+        other = neighbor & ((1 << index_bits) - 1)
+        return (neighbor >> index_bits) << 2 * index_bits | min(point, other) << index_bits | max(point, other)
+
+    def pair_keys(self, point: int, first_key: int) -> list[int]:
+        """Pair keys (see pair_key) of a point with the higher point numbers, from first_key on."""
+        (xs, ys, zs), index_bits, higher = self.axes, self.index_bits, point + 1
+        x1, y1, z1, lower = xs[point], ys[point], zs[point], point << index_bits
+        return [
+            key
+            for other, x2, y2, z2 in zip(range(higher, len(self)), xs[higher:], ys[higher:], zs[higher:])
+            if (key := ((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2) << 2 * index_bits | lower | other)
+            >= first_key
+        ]
+
+    def remaining_pairs(self, first_key: int) -> Iterator[tuple[int, int, int]]:
+        """All pairs from the one with pair key first_key on, in order (brute force: all pairs are generated)."""
+        index_bits = self.index_bits
+        index_mask = (1 << index_bits) - 1
+        keys: list[int] = []
+        for point in range(len(self)):
+            keys.extend(self.pair_keys(point, first_key))
+        keys.sort()
+        for key in keys:
+            yield key >> 2 * index_bits, key >> index_bits & index_mask, key & index_mask
+
+    def pairs_by_distance(self) -> Iterator[tuple[int, int, int]]:
+        """All pairs of points (squared distance, point number, higher point number) in increasing order.
+
+        Every pair is in the stream of one of its points: of the lower point
+        number when both numbers are even or both are odd, of the higher one
+        otherwise (so all streams have about n / 2 pairs). When more than
+        SORT_PAIRS_PER_POINT pairs per point are taken (e.g. far outliers,
+        where connecting them takes almost all pairs), the remaining pairs are
+        generated all at once and sorted instead.
+        """
+        index_bits = self.index_bits
+        index_mask = (1 << index_bits) - 1
+        streams = [NeighborStream(self, point) for point in range(len(self))]
+        pairs = [
+            self.pair_key(point, neighbor)
+            for point in range(len(self))
+            if (neighbor := streams[point].pop()) is not None
+        ]
+        heapq.heapify(pairs)
+        for _ in range(SORT_PAIRS_PER_POINT * len(self)):
+            if not pairs:
+                return
+            pair = pairs[0]
+            point, other = pair >> index_bits & index_mask, pair & index_mask
+            yield pair >> 2 * index_bits, point, other
+            stream = streams[other if (point ^ other) & 1 else point]
+            if (neighbor := stream.pop()) is not None:
+                heapq.heapreplace(pairs, self.pair_key(stream.point, neighbor))
+            else:
+                heapq.heappop(pairs)
+        if pairs:
+            yield from self.remaining_pairs(pairs[0])
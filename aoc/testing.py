@@ -0,0 +1,40 @@
+"""Advent of Code - examples as tests, without importing pytest when solving
+
+The solution modules only import pytest when their tests are run. That keeps
+importing a solution (python -m aoc run, benchmarks) free of the pytest
+import, plugin loading and collection:
+- parametrize() is pytest.mark.parametrize when pytest is imported (i.e. when
+  pytest collects the module), otherwise the test is returned unchanged.
+- run_tests() runs the tests of a solution script with pytest, unless they
+  are skipped with --skip-tests or the AOC_SKIP_TESTS environment variable.
+"""
+
+import importlib
+import os
+import sys
+from typing import Any, Callable, Iterable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+SKIP_TESTS_ENV_VAR = "AOC_SKIP_TESTS"
+SKIP_TESTS_OPTION = "--skip-tests"
+
+
+def parametrize(argnames: str, argvalues: Iterable[Any]) -> Callable[[F], F]:
+    """pytest.mark.parametrize, without importing pytest."""
+    pytest = sys.modules.get("pytest")
+    if pytest is None:
+        return lambda func: func
+    return pytest.mark.parametrize(argnames, argvalues)
+
+
+def skip_tests() -> bool:
+    return bool(os.environ.get(SKIP_TESTS_ENV_VAR)) or SKIP_TESTS_OPTION in sys.argv[1:]
+
+
+def run_tests(filename: str) -> None:
+    """Run the tests of a solution script with pytest (unless skipped)."""
+    if skip_tests():
+        return
+    pytest = importlib.import_module("pytest")
+    pytest.main(["-vv", filename])